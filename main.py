@@ -18,16 +18,22 @@ from tkinter import messagebox
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    # Importar componentes principales
-    from ui.ventana_principal import VentanaPrincipal
-    from utils.validacion import ValidacionError
 
-except ImportError as e:
-    print(f"Error al importar módulos necesarios: {e}")
-    print("Asegúrese de que todas las dependencias estén instaladas:")
-    print("pip install -r requirements.txt")
-    sys.exit(1)
+def importar_componentes():
+    """
+    Importa los componentes principales de la interfaz.
+    Se hace al ejecutar la aplicación y no al importar este módulo: el proceso de
+    render de la vista previa (iniciado con "spawn") vuelve a importar main.py y
+    no debe cargar la interfaz.
+    """
+    try:
+        from ui.ventana_principal import VentanaPrincipal
+    except ImportError as e:
+        print(f"Error al importar módulos necesarios: {e}")
+        print("Asegúrese de que todas las dependencias estén instaladas:")
+        print("pip install -r requirements.txt")
+        sys.exit(1)
+    return VentanaPrincipal
 
 
 def verificar_dependencias():
@@ -88,6 +94,9 @@ def main():
     print("=" * 60)
     print("Iniciando aplicación...")
 
+    # Importar componentes principales
+    VentanaPrincipal = importar_componentes()
+
     # Configurar aplicación
     configurar_aplicacion()
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from modelos.tarea import Tarea
 
 
@@ -18,6 +18,7 @@ class Estacion:
         self.tareas_asignadas: List[Tarea] = []
         self.tiempo_total = 0.0
         self.tiempo_ciclo_max = tiempo_ciclo_max
+        self._ids_tareas_texto: Optional[str] = None  # memo de obtener_ids_tareas_texto
     
     def puede_agregar_tarea(self, tarea: Tarea) -> bool:
         """
@@ -34,6 +35,7 @@ class Estacion:
         if self.puede_agregar_tarea(tarea):
             self.tareas_asignadas.append(tarea)
             self.tiempo_total += tarea.tiempo
+            self._ids_tareas_texto = None
             return True
         return False
     
@@ -43,6 +45,7 @@ class Estacion:
             if tarea.id == tarea_id:
                 self.tiempo_total -= tarea.tiempo
                 self.tareas_asignadas.pop(i)
+                self._ids_tareas_texto = None
                 return True
         return False
     
@@ -60,8 +63,17 @@ class Estacion:
         """Retorna lista de IDs de tareas asignadas."""
         return [tarea.id for tarea in self.tareas_asignadas]
     
+    def obtener_ids_tareas_texto(self) -> str:
+        """
+        Retorna los IDs de tareas asignadas separados por comas.
+        Se calcula una vez y se invalida al agregar o remover tareas.
+        """
+        if self._ids_tareas_texto is None:
+            self._ids_tareas_texto = ", ".join(self.obtener_ids_tareas())
+        return self._ids_tareas_texto
+    
     def __str__(self) -> str:
-        tareas_ids = ", ".join(self.obtener_ids_tareas())
+        tareas_ids = self.obtener_ids_tareas_texto()
         return f"Estación {self.numero}: [{tareas_ids}] ({self.tiempo_total:.1f}min)"
     
     def __repr__(self) -> str:
@@ -26,6 +26,14 @@ class LineaProduccion:
         self.tareas[tarea.id] = tarea
         self._actualizar_relaciones_precedencia()
     
+    def agregar_tareas(self, tareas: List[Tarea]) -> None:
+        """
+        Agrega un lote de tareas al sistema.
+        Las relaciones de precedencia se reconstruyen una sola vez para todo el lote.
+        """
+        self.tareas.update((tarea.id, tarea) for tarea in tareas)
+        self._actualizar_relaciones_precedencia()
+    
     def _actualizar_relaciones_precedencia(self) -> None:
         """Actualiza las relaciones de precedencia entre todas las tareas."""
         # Limpiar sucesores existentes
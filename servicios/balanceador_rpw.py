@@ -21,6 +21,12 @@ class BalanceadorRPW:
         self.tareas_ordenadas: List[Tarea] = []
         self.asignaciones: Dict[str, int] = {}  # tarea_id -> numero_estacion
     
+    def reset(self, linea_produccion: LineaProduccion) -> None:
+        """Prepara el balanceador para una nueva ejecución sobre la línea indicada."""
+        self.linea_produccion = linea_produccion
+        self.tareas_ordenadas = []
+        self.asignaciones.clear()
+    
     def balancear(self) -> Tuple[List[Estacion], Dict[str, any]]:
         """
         Ejecuta el algoritmo RPW completo y retorna estaciones balanceadas.
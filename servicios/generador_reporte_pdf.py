@@ -20,7 +20,7 @@ from reportlab.graphics import renderPDF
 
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, BinaryIO
 from io import BytesIO
 
 from modelos.estacion import Estacion
@@ -137,7 +137,7 @@ class GeneradorReportePDF:
                                linea_produccion: LineaProduccion,
                                estaciones: List[Estacion],
                                metricas: Dict[str, Any],
-                               archivo_destino: str) -> str:
+                               archivo_destino: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
         """
         Genera un reporte PDF completo con todos los análisis.
 
@@ -145,10 +145,11 @@ class GeneradorReportePDF:
             linea_produccion: Línea de producción balanceada
             estaciones: Lista de estaciones con asignaciones
             metricas: Métricas calculadas del balanceamiento
-            archivo_destino: Ruta del archivo PDF a generar
+            archivo_destino: Ruta del archivo PDF a generar, o un objeto binario
+                escribible (p. ej. BytesIO) para generar el PDF en memoria
 
         Returns:
-            Ruta del archivo generado
+            Ruta (u objeto) donde se generó el reporte
         """
         try:
             # Validaciones previas
@@ -424,7 +425,7 @@ class GeneradorReportePDF:
         for i, estacion in enumerate(estaciones):
             utilizacion = estacion.calcular_utilizacion()
             tiempo_ocioso = estacion.obtener_tiempo_ocioso()
-            tareas_asignadas = ', '.join(estacion.obtener_ids_tareas())
+            tareas_asignadas = estacion.obtener_ids_tareas_texto()
 
             # Determinar estado y color
             if utilizacion >= 90:
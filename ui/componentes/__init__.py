@@ -6,11 +6,13 @@ Contiene:
 - PanelResultados: Panel para mostrar resultados del balanceamiento
 - PanelGraficos: Panel para visualización de gráficos y métricas
 - PanelVistaPrevia: Panel para vista previa y exportación de reportes PDF
+- TablaVirtual: Treeview con desplazamiento virtual para tablas grandes
 """
 
 from .panel_entrada import PanelEntradaDatos
 from .panel_resultados import PanelResultados
 from .panel_graficos import PanelGraficos
 from .panel_vista_previa_pdf import PanelVistaPrevia
+from .tabla_virtual import TablaVirtual
 
-__all__ = ['PanelEntradaDatos', 'PanelResultados', 'PanelGraficos', 'PanelVistaPrevia']
\ No newline at end of file
+__all__ = ['PanelEntradaDatos', 'PanelResultados', 'PanelGraficos', 'PanelVistaPrevia', 'TablaVirtual']
\ No newline at end of file
@@ -397,8 +397,9 @@ class PanelEntradaDatos:
     def _actualizar_tabla_tareas(self):
         """Actualiza la tabla de tareas."""
         # Limpiar tabla existente
-        for item in self.tree_tareas.get_children():
-            self.tree_tareas.delete(item)
+        hijos = self.tree_tareas.get_children()
+        if hijos:
+            self.tree_tareas.delete(*hijos)
         
         # Agregar tareas actuales
         for tarea in self.tareas_data:
@@ -1,10 +1,117 @@
-import tkinter as tk
 from tkinter import ttk
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
-from typing import List, Dict
+from matplotlib.patches import Wedge, Rectangle
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.lines import Line2D
+from dataclasses import dataclass
+from typing import List, Dict, Callable, Optional
 from utils.estilos import EstilosModernos, COLORES, ESPACIADO
+from utils.graf_kernels import calcular_utilizaciones
+
+
+# Número de barras que se crean de antemano en el gráfico de utilización
+MAX_ESTACIONES = 30
+
+# Umbrales de utilización (%) y colores: baja carga, óptima, alta carga, cuello de botella
+_BINS_UTILIZACION = np.array([70, 85, 98])
+_PALETA_UTILIZACION = np.array(['#17A2B8', '#28A745', '#FFC107', '#DC3545'])
+
+# Umbrales de las métricas de eficiencia (%) y colores: malo, regular, bueno, excelente
+_BINS_METRICAS = np.array([70, 80, 90])
+_PALETA_METRICAS = np.array(['#DC3545', '#FD7E14', '#FFC107', '#28A745'])
+
+# Categorías del gráfico de métricas de eficiencia
+_CATEGORIAS_METRICAS = ['Eficiencia\nLínea', 'Utilización\nPromedio', 'Utilización\nCapacidad']
+
+# Colores del gráfico de pastel (colormap Set3 evaluado una sola vez)
+_COLORES_PASTEL = plt.cm.Set3(np.arange(plt.cm.Set3.N))
+
+# DPI lógico de los gráficos embebidos. En pantallas HiDPI FigureCanvasTkAgg ya lo
+# multiplica por el factor de escala de Tk, por lo que aquí no se ajusta
+DPI_PANTALLA = 72
+
+# Líneas de referencia horizontales: (nivel, color, etiqueta)
+_REFERENCIAS_UTILIZACION = (
+    (100, 'red', 'Capacidad Máxima (100%)'),
+    (85, 'orange', 'Utilización Alta (85%)'),
+    (70, 'green', 'Utilización Óptima (70%)')
+)
+_REFERENCIAS_METRICAS = (
+    (90, 'green', 'Excelente (90%)'),
+    (80, 'orange', 'Bueno (80%)'),
+    (70, 'red', 'Aceptable (70%)')
+)
+
+# Ventana (ms) en la que varias llamadas a actualizar_graficos se agrupan en una
+DEBOUNCE_MS = 30
+
+# El estilo global de matplotlib se aplica una sola vez por proceso
+_ESTILO_CONFIGURADO = False
+
+
+def _agregar_lineas_referencia(ax, referencias, alpha: float):
+    """
+    Agrega las líneas de referencia horizontales como una sola LineCollection.
+    La coordenada x va en fracción de los ejes, así que no depende de xlim.
+    Retorna la colección y los manejadores para construir la leyenda.
+    """
+    niveles, colores, etiquetas = zip(*referencias)
+    coleccion = LineCollection([[(0, y), (1, y)] for y in niveles], colors=colores,
+                               linestyles='--', alpha=alpha, transform=ax.get_yaxis_transform())
+    ax.add_collection(coleccion, autolim=False)
+    manejadores = [Line2D([], [], color=color, linestyle='--', alpha=alpha, label=etiqueta)
+                   for color, etiqueta in zip(colores, etiquetas)]
+    return coleccion, manejadores
+
+
+@dataclass
+class InstantaneaEstaciones:
+    """
+    Datos de las estaciones extraídos en una sola pasada y compartidos
+    por todos los gráficos.
+    """
+    numeros: np.ndarray
+    tiempos: np.ndarray
+    utilizaciones: np.ndarray
+    num_tareas: np.ndarray
+    etiquetas_cortas: List[str]  # "E1", "E2", ...
+    etiquetas_largas: List[str]  # "Est. 1", "Est. 2", ...
+    etiquetas_tareas: List[str]  # IDs de tareas de cada estación (truncados)
+    tiempo_ciclo: float
+    
+    def __len__(self) -> int:
+        return len(self.numeros)
+    
+    @classmethod
+    def desde_estaciones(cls, estaciones: List) -> 'InstantaneaEstaciones':
+        """Construye la instantánea recorriendo la lista de estaciones una sola vez."""
+        numeros, tiempos, num_tareas, etiquetas_tareas = [], [], [], []
+        for est in estaciones:
+            numeros.append(est.numero)
+            tiempos.append(est.tiempo_total)
+            num_tareas.append(len(est.tareas_asignadas))
+            texto = est.obtener_ids_tareas_texto()
+            etiquetas_tareas.append(texto if len(texto) <= 15 else texto[:12] + '...')
+        
+        tiempo_ciclo = float(estaciones[0].tiempo_ciclo_max) if estaciones else 0.0
+        tiempos = np.array(tiempos, dtype=np.float64)
+        
+        return cls(
+            numeros=np.array(numeros, dtype=np.int64),
+            tiempos=tiempos,
+            utilizaciones=calcular_utilizaciones(tiempos, tiempo_ciclo),
+            num_tareas=np.array(num_tareas, dtype=np.int64),
+            etiquetas_cortas=[f"E{numero}" for numero in numeros],
+            etiquetas_largas=[f"Est. {numero}" for numero in numeros],
+            etiquetas_tareas=etiquetas_tareas,
+            tiempo_ciclo=tiempo_ciclo
+        )
 
 
 class PanelGraficos:
@@ -17,6 +124,20 @@ class PanelGraficos:
         self.frame_principal = None
         self.canvas_utilizacion = None
         self.canvas_comparacion = None
+        self.notebook = None
+        self.frame_comparacion = None
+        self._pending_redraw = False
+        self._last_snapshot = None  # InstantaneaEstaciones de la última actualización
+        self._last_metricas = None
+        self._last_key = None  # Huella de los datos dibujados por última vez
+        self._pending_update = None  # (estaciones, metricas) a aplicar tras el debounce
+        self._debounce_id = None
+        self._bg_utilizacion = None  # Fondo del gráfico de utilización para blit
+        self._layout_utilizacion = None  # Ejes configurados en el último dibujado completo
+        self._export_pool = ThreadPoolExecutor(max_workers=1)
+        self._export_lock = threading.Lock()  # Evita exportaciones simultáneas
+        self._export_canvas = None  # Figura de exportación, creada en la primera exportación
+        self._export_axes = None
         
         # Configurar estilo de matplotlib
         self._configurar_matplotlib()
@@ -24,7 +145,14 @@ class PanelGraficos:
         self._crear_interfaz()
     
     def _configurar_matplotlib(self):
-        """Configura el estilo de matplotlib para que coincida con la aplicación."""
+        """
+        Configura el estilo de matplotlib para que coincida con la aplicación.
+        Solo la primera instancia modifica los rcParams globales.
+        """
+        global _ESTILO_CONFIGURADO
+        if _ESTILO_CONFIGURADO:
+            return
+        
         plt.style.use('default')
         plt.rcParams.update({
             'font.size': 9,
@@ -40,6 +168,7 @@ class PanelGraficos:
             'axes.linewidth': 0.8,
             'grid.alpha': 0.3
         })
+        _ESTILO_CONFIGURADO = True
     
     def _crear_interfaz(self):
         """Crea la interfaz del panel de gráficos."""
@@ -54,14 +183,15 @@ class PanelGraficos:
         titulo.pack(anchor='w', pady=(0, ESPACIADO['normal']))
         
         # Crear notebook para organizar gráficos
-        notebook = ttk.Notebook(self.frame_principal)
-        notebook.pack(fill='both', expand=True)
+        self.notebook = ttk.Notebook(self.frame_principal)
+        self.notebook.pack(fill='both', expand=True)
         
         # Pestaña de utilización por estación
-        self._crear_pestana_utilizacion(notebook)
+        self._crear_pestana_utilizacion(self.notebook)
         
-        # Pestaña de comparación y análisis
-        self._crear_pestana_comparacion(notebook)
+        # Pestaña de comparación y análisis (los gráficos se crean al visitarla)
+        self._crear_pestana_comparacion(self.notebook)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Empaquetar frame principal
         shadow_frame.pack(fill='both', expand=True, padx=2, pady=2)
@@ -73,190 +203,473 @@ class PanelGraficos:
         notebook.add(frame_utilizacion, text='📊 Utilización por Estación')
         
         # Crear figura para gráfico de utilización
-        self.fig_utilizacion = Figure(figsize=(10, 6), dpi=100, facecolor=COLORES['superficie'])
+        self.fig_utilizacion = Figure(figsize=(8, 4.5), dpi=DPI_PANTALLA,
+                                      facecolor=COLORES['superficie'], layout='constrained')
         self.ax_utilizacion = self.fig_utilizacion.add_subplot(111)
         
         # Canvas para matplotlib
         self.canvas_utilizacion = FigureCanvasTkAgg(self.fig_utilizacion, frame_utilizacion)
         self.canvas_utilizacion.get_tk_widget().pack(fill='both', expand=True)
         
+        # Recapturar el fondo en cada dibujado completo (incluye redimensionado)
+        self.canvas_utilizacion.mpl_connect('draw_event', self._on_draw_utilizacion)
+        
         # Inicializar gráfico vacío
         self._inicializar_grafico_utilizacion()
     
     def _crear_pestana_comparacion(self, notebook):
-        """Crea la pestaña de gráficos de comparación."""
-        frame_comparacion = ttk.Frame(notebook, style='Superficie.TFrame', padding=ESPACIADO['pequeno'])
-        notebook.add(frame_comparacion, text='📈 Análisis Comparativo')
-        
+        """
+        Crea la pestaña de gráficos de comparación.
+        Solo se agrega el frame vacío; la figura se construye en la primera visita.
+        """
+        self.frame_comparacion = ttk.Frame(notebook, style='Superficie.TFrame', padding=ESPACIADO['pequeno'])
+        notebook.add(self.frame_comparacion, text='📈 Análisis Comparativo')
+    
+    def _construir_graficos_comparacion(self):
+        """Crea la figura y el canvas de comparación y dibuja los últimos datos recibidos."""
         # Crear figura para gráficos de comparación
-        self.fig_comparacion = Figure(figsize=(12, 8), dpi=100, facecolor=COLORES['superficie'])
+        self.fig_comparacion = Figure(figsize=(9, 6), dpi=DPI_PANTALLA,
+                                      facecolor=COLORES['superficie'])
+        
+        # Rejilla 2x2 creada una sola vez con márgenes fijos
+        ejes = self.fig_comparacion.subplots(2, 2)
+        (self.ax_tiempos, self.ax_pastel), (self.ax_eficiencia, self.ax_tareas) = ejes
+        self.fig_comparacion.subplots_adjust(left=0.08, right=0.97, bottom=0.08, top=0.94,
+                                             hspace=0.4, wspace=0.3)
+        
+        # Artistas reutilizables de los gráficos de tiempos, pastel y métricas
+        self._configurar_ejes_tiempos()
+        self._configurar_ejes_pastel()
+        self._configurar_ejes_eficiencia()
         
         # Canvas para matplotlib
-        self.canvas_comparacion = FigureCanvasTkAgg(self.fig_comparacion, frame_comparacion)
+        self.canvas_comparacion = FigureCanvasTkAgg(self.fig_comparacion, self.frame_comparacion)
         self.canvas_comparacion.get_tk_widget().pack(fill='both', expand=True)
         
-        # Inicializar gráficos vacíos
-        self._inicializar_graficos_comparacion()
+        # Inicializar gráficos vacíos o con los datos pendientes
+        if self._last_snapshot is not None:
+            self._actualizar_graficos_comparacion(self._last_snapshot, self._last_metricas)
+        else:
+            self._inicializar_graficos_comparacion()
+    
+    def _on_tab_changed(self, event):
+        """Construye la pestaña de comparación la primera vez que se selecciona."""
+        if self.canvas_comparacion is not None:
+            return
+        
+        if self.notebook.select() == str(self.frame_comparacion):
+            self._construir_graficos_comparacion()
     
     def _inicializar_grafico_utilizacion(self):
-        """Inicializa el gráfico de utilización vacío."""
+        """
+        Inicializa el gráfico de utilización vacío.
+        Crea una sola vez las barras, textos, líneas de referencia y leyenda
+        que luego se reutilizan en cada actualización.
+        """
         self.ax_utilizacion.clear()
+        self._bars = None
+        self._layout_utilizacion = None
         self.ax_utilizacion.set_title('Utilización por Estación', fontsize=14, fontweight='bold')
-        self.ax_utilizacion.set_xlabel('Estación')
-        self.ax_utilizacion.set_ylabel('Utilización (%)')
+        self.ax_utilizacion.set_xlabel('Estación', fontsize=12)
+        self.ax_utilizacion.set_ylabel('Utilización (%)', fontsize=12)
         self.ax_utilizacion.set_ylim(0, 100)
+        self.ax_utilizacion.set_xticks([])
         self.ax_utilizacion.grid(True, alpha=0.3)
         
         # Líneas de referencia
-        self.ax_utilizacion.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='Capacidad Máxima')
-        self.ax_utilizacion.axhline(y=85, color='orange', linestyle='--', alpha=0.7, label='Utilización Alta')
-        self.ax_utilizacion.axhline(y=70, color='green', linestyle='--', alpha=0.7, label='Utilización Óptima')
+        self._ref_lc, manejadores = _agregar_lineas_referencia(self.ax_utilizacion, _REFERENCIAS_UTILIZACION, 0.7)
+        self._legend = self.ax_utilizacion.legend(handles=manejadores, loc='upper right')
         
-        self.ax_utilizacion.legend()
-        self.ax_utilizacion.text(0.5, 0.5, 'Ejecute el balanceamiento para ver resultados', 
-                                transform=self.ax_utilizacion.transAxes, 
-                                ha='center', va='center', fontsize=12, alpha=0.6)
+        # Barras y textos reutilizables (ocultos hasta tener datos)
+        self._crear_barras_utilizacion(MAX_ESTACIONES)
         
-        self.fig_utilizacion.tight_layout()
-        self.canvas_utilizacion.draw()
+        self._texto_vacio = self.ax_utilizacion.text(0.5, 0.5, 'Ejecute el balanceamiento para ver resultados', 
+                                                     transform=self.ax_utilizacion.transAxes, 
+                                                     ha='center', va='center', fontsize=12, alpha=0.6)
+        
+        self._programar_dibujo()
     
-    def _inicializar_graficos_comparacion(self):
-        """Inicializa los gráficos de comparación vacíos."""
-        self.fig_comparacion.clear()
+    def _crear_barras_utilizacion(self, capacidad: int):
+        """
+        Crea (o recrea con más capacidad) el conjunto de barras y textos reutilizables.
+        Son artistas animados: no forman parte del fondo y se dibujan con blit.
+        """
+        # Eliminar artistas anteriores si existen
+        if getattr(self, '_bars', None) is not None:
+            self._bars.remove()
+            for texto in self._bar_value_texts + self._bar_inner_texts:
+                texto.remove()
+        
+        self._bars = self.ax_utilizacion.bar(range(capacidad), [0] * capacidad, alpha=0.8,
+                                             edgecolor='white', linewidth=1, visible=False,
+                                             animated=True)
+        self._bar_value_texts = [
+            self.ax_utilizacion.text(0, 0, '', ha='center', va='bottom', fontweight='bold',
+                                     visible=False, animated=True)
+            for _ in range(capacidad)
+        ]
+        self._bar_inner_texts = [
+            self.ax_utilizacion.text(0, 0, '', ha='center', va='center', fontsize=8,
+                                     color='white', fontweight='bold', visible=False, animated=True)
+            for _ in range(capacidad)
+        ]
+    
+    def _configurar_ejes_tiempos(self):
+        """
+        Configura una sola vez los ejes de tiempos por estación y crea sus barras,
+        textos de valor y línea de tiempo de ciclo reutilizables.
+        """
+        ax = self.ax_tiempos
+        ax.set_title('Tiempo Total por Estación', fontweight='bold', fontsize=11)
+        ax.set_xlabel('Estación')
+        ax.set_ylabel('Tiempo (min)')
+        ax.grid(True, alpha=0.3)
+        
+        self._tiempos_texto_vacio = ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes,
+                                            ha='center', va='center', alpha=0.6)
         
-        # Crear subplots
-        gs = self.fig_comparacion.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
+        # Línea de referencia del tiempo de ciclo y su leyenda
+        self._linea_ciclo = ax.axhline(y=0, color='red', linestyle='--', alpha=0.7,
+                                       label='Tiempo de Ciclo', visible=False)
+        self._leyenda_tiempos = ax.legend(handles=[self._linea_ciclo], fontsize=8)
+        self._leyenda_tiempos.set_visible(False)
         
+        self._barras_tiempos = None
+        self._crear_barras_tiempos(MAX_ESTACIONES)
+    
+    def _crear_barras_tiempos(self, capacidad: int):
+        """Crea (o recrea con más capacidad) las barras y textos del gráfico de tiempos."""
+        # Eliminar artistas anteriores si existen
+        if self._barras_tiempos is not None:
+            self._barras_tiempos.remove()
+            for texto in self._textos_tiempos:
+                texto.remove()
+        
+        ax = self.ax_tiempos
+        self._barras_tiempos = ax.bar(range(capacidad), [0] * capacidad, color=COLORES['primario'],
+                                      alpha=0.7, visible=False)
+        self._textos_tiempos = [
+            ax.text(0, 0, '', ha='center', va='bottom', fontsize=9, visible=False)
+            for _ in range(capacidad)
+        ]
+    
+    def _ocultar_grafico_tiempos(self):
+        """Oculta las barras de tiempos y muestra el mensaje de 'Sin datos'."""
+        for barra, texto in zip(self._barras_tiempos.patches, self._textos_tiempos):
+            barra.set_visible(False)
+            texto.set_visible(False)
+        self._linea_ciclo.set_visible(False)
+        self._leyenda_tiempos.set_visible(False)
+        self.ax_tiempos.set_xticks([])
+        self._tiempos_texto_vacio.set_visible(True)
+    
+    def _configurar_ejes_eficiencia(self):
+        """
+        Configura una sola vez los ejes de métricas de eficiencia y crea sus
+        barras, textos de valor, líneas de referencia y leyenda reutilizables.
+        """
+        ax = self.ax_eficiencia
+        ax.set_title('Métricas de Eficiencia', fontweight='bold', fontsize=11)
+        ax.set_ylabel('Porcentaje (%)')
+        ax.grid(True, alpha=0.3)
+        
+        self._barras_metricas = ax.bar(_CATEGORIAS_METRICAS, [0] * len(_CATEGORIAS_METRICAS),
+                                       alpha=0.8, visible=False)
+        self._textos_metricas = [
+            ax.text(barra.get_x() + barra.get_width()/2., 0, '', ha='center', va='bottom',
+                    fontsize=9, fontweight='bold', visible=False)
+            for barra in self._barras_metricas
+        ]
+        ax.set_ylim(0, 100)
+        
+        # Líneas de referencia
+        self._ref_lc_metricas, manejadores = _agregar_lineas_referencia(ax, _REFERENCIAS_METRICAS, 0.5)
+        self._leyenda_metricas = ax.legend(handles=manejadores, fontsize=7, loc='upper right')
+        
+        self._metricas_texto_vacio = ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes,
+                                             ha='center', va='center', alpha=0.6)
+    
+    def _ocultar_grafico_metricas(self):
+        """Oculta las barras de métricas y muestra el mensaje de 'Sin datos'."""
+        for barra, texto in zip(self._barras_metricas, self._textos_metricas):
+            barra.set_visible(False)
+            texto.set_visible(False)
+        self._ref_lc_metricas.set_visible(False)
+        self._leyenda_metricas.set_visible(False)
+        self._metricas_texto_vacio.set_visible(True)
+    
+    def _configurar_ejes_pastel(self):
+        """
+        Configura una sola vez los ejes del pastel y crea sus sectores y textos.
+        Estos ejes no se limpian con cla(); en cada actualización solo se
+        modifican los ángulos, colores y textos de los artistas existentes.
+        """
+        ax = self.ax_pastel
+        ax.set_title('Distribución de Carga de Trabajo', fontweight='bold', fontsize=11)
+        ax.set_aspect('equal')
+        ax.set_frame_on(False)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_xlim(-1.25, 1.25)
+        ax.set_ylim(-1.25, 1.25)
+        
+        self._pie_texto_vacio = ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes,
+                                        ha='center', va='center', alpha=0.6)
+        self._pie_wedges = []
+        self._crear_sectores_pastel(MAX_ESTACIONES)
+    
+    def _crear_sectores_pastel(self, capacidad: int):
+        """Crea (o recrea con más capacidad) los sectores y textos del pastel."""
+        # Eliminar artistas anteriores si existen
+        for artista in self._pie_wedges + getattr(self, '_pie_labels', []) + getattr(self, '_pie_pct_texts', []):
+            artista.remove()
+        
+        ax = self.ax_pastel
+        self._pie_wedges = []
+        self._pie_labels = []
+        self._pie_pct_texts = []
+        for _ in range(capacidad):
+            wedge = Wedge((0, 0), 1, 0, 0, clip_on=False, visible=False)
+            ax.add_patch(wedge)
+            self._pie_wedges.append(wedge)
+            self._pie_labels.append(
+                ax.text(0, 0, '', va='center', clip_on=False, visible=False)
+            )
+            self._pie_pct_texts.append(
+                ax.text(0, 0, '', ha='center', va='center', color='white',
+                        fontweight='bold', fontsize=8, clip_on=False, visible=False)
+            )
+    
+    def _ocultar_pastel(self):
+        """Oculta los sectores del pastel y muestra el mensaje de 'Sin datos'."""
+        for wedge, etiqueta, porcentaje in zip(self._pie_wedges, self._pie_labels, self._pie_pct_texts):
+            wedge.set_visible(False)
+            etiqueta.set_visible(False)
+            porcentaje.set_visible(False)
+        self._pie_texto_vacio.set_visible(True)
+    
+    def _inicializar_graficos_comparacion(self):
+        """Inicializa los gráficos de comparación vacíos."""
         # Gráfico de barras de tiempo por estación
-        self.ax_tiempos = self.fig_comparacion.add_subplot(gs[0, 0])
-        self.ax_tiempos.set_title('Tiempo Total por Estación', fontweight='bold')
-        self.ax_tiempos.set_xlabel('Estación')
-        self.ax_tiempos.set_ylabel('Tiempo (min)')
+        self._ocultar_grafico_tiempos()
         
         # Gráfico de pastel de distribución de carga
-        self.ax_pastel = self.fig_comparacion.add_subplot(gs[0, 1])
-        self.ax_pastel.set_title('Distribución de Carga de Trabajo', fontweight='bold')
+        self._ocultar_pastel()
         
-        # Gráfico de línea de eficiencia
-        self.ax_eficiencia = self.fig_comparacion.add_subplot(gs[1, 0])
-        self.ax_eficiencia.set_title('Métricas de Eficiencia', fontweight='bold')
-        self.ax_eficiencia.set_ylabel('Valor (%)')
+        # Gráfico de métricas de eficiencia
+        self._ocultar_grafico_metricas()
         
         # Gráfico de barras horizontales de tareas por estación
-        self.ax_tareas = self.fig_comparacion.add_subplot(gs[1, 1])
+        self.ax_tareas.cla()
         self.ax_tareas.set_title('Número de Tareas por Estación', fontweight='bold')
         self.ax_tareas.set_xlabel('Número de Tareas')
+        self.ax_tareas.text(0.5, 0.5, 'Sin datos', transform=self.ax_tareas.transAxes, 
+                            ha='center', va='center', alpha=0.6)
         
-        # Texto informativo
-        for ax in [self.ax_tiempos, self.ax_pastel, self.ax_eficiencia, self.ax_tareas]:
-            ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes, 
-                   ha='center', va='center', alpha=0.6)
-        
-        self.fig_comparacion.tight_layout()
-        self.canvas_comparacion.draw()
+        self._programar_dibujo()
     
     def actualizar_graficos(self, estaciones: List, metricas: Dict):
-        """Actualiza todos los gráficos con nuevos datos."""
+        """
+        Actualiza todos los gráficos con nuevos datos.
+        Las llamadas en ráfaga se agrupan: solo se dibujan los últimos datos
+        recibidos dentro de una ventana de DEBOUNCE_MS.
+        """
+        self._pending_update = (estaciones, metricas)
+        if self._debounce_id is None:
+            self._debounce_id = self.parent.after(DEBOUNCE_MS, self._aplicar_actualizacion)
+    
+    def _aplicar_actualizacion(self):
+        """Aplica la última actualización pendiente de los gráficos."""
+        self._debounce_id = None
+        estaciones, metricas = self._pending_update
+        self._pending_update = None
+        
         if not estaciones:
-            self._inicializar_grafico_utilizacion()
-            self._inicializar_graficos_comparacion()
+            self.limpiar_graficos()
+            return
+        
+        # Extraer los datos de las estaciones una sola vez para todos los gráficos
+        snapshot = InstantaneaEstaciones.desde_estaciones(estaciones)
+        
+        # Evitar redibujar si los datos no cambiaron desde la última actualización
+        key = self._calcular_huella(snapshot, metricas)
+        if key == self._last_key:
             return
+        self._last_key = key
+        
+        self._last_snapshot = snapshot
+        self._last_metricas = metricas
         
-        self._actualizar_grafico_utilizacion(estaciones)
-        self._actualizar_graficos_comparacion(estaciones, metricas)
+        self._actualizar_grafico_utilizacion(snapshot)
+        
+        # La pestaña de comparación se actualiza solo si ya fue construida
+        if self.canvas_comparacion is not None:
+            self._actualizar_graficos_comparacion(snapshot, metricas)
     
-    def _actualizar_grafico_utilizacion(self, estaciones: List):
-        """Actualiza el gráfico de utilización por estación."""
-        self.ax_utilizacion.clear()
+    @staticmethod
+    def _calcular_huella(snapshot: InstantaneaEstaciones, metricas: Dict) -> int:
+        """Calcula una huella barata de todo lo que se dibuja en los gráficos."""
+        return hash((
+            snapshot.numeros.tobytes(),
+            snapshot.tiempos.tobytes(),
+            snapshot.num_tareas.tobytes(),
+            snapshot.tiempo_ciclo,
+            tuple(snapshot.etiquetas_tareas),
+            tuple(PanelGraficos._valores_metricas(metricas))
+        ))
+    
+    def _actualizar_grafico_utilizacion(self, snapshot: InstantaneaEstaciones):
+        """Actualiza el gráfico de utilización por estación reutilizando sus artistas."""
+        num_estaciones = len(snapshot)
+        if num_estaciones > len(self._bars.patches):
+            self._crear_barras_utilizacion(num_estaciones)
         
         # Preparar datos
-        numeros_estacion = [f"Est. {est.numero}" for est in estaciones]
-        utilizaciones = [est.calcular_utilizacion() for est in estaciones]
-        
-        # Crear colores basados en utilización
-        colores = []
-        for util in utilizaciones:
-            if util >= 98:
-                colores.append('#DC3545')  # Rojo - Cuello de botella
-            elif util >= 85:
-                colores.append('#FFC107')  # Amarillo - Alta carga
-            elif util >= 70:
-                colores.append('#28A745')  # Verde - Óptima
-            else:
-                colores.append('#17A2B8')  # Azul - Baja carga
-        
-        # Crear gráfico de barras
-        barras = self.ax_utilizacion.bar(numeros_estacion, utilizaciones, color=colores, alpha=0.8, edgecolor='white', linewidth=1)
+        numeros_estacion = snapshot.etiquetas_largas
+        utilizaciones = snapshot.utilizaciones
         
-        # Configurar gráfico
-        self.ax_utilizacion.set_title('Utilización por Estación', fontsize=14, fontweight='bold')
-        self.ax_utilizacion.set_xlabel('Estación', fontsize=12)
-        self.ax_utilizacion.set_ylabel('Utilización (%)', fontsize=12)
-        self.ax_utilizacion.set_ylim(0, max(105, max(utilizaciones) * 1.1))
-        self.ax_utilizacion.grid(True, alpha=0.3)
+        # Colores basados en utilización (clasificación vectorizada por umbrales)
+        colores = _PALETA_UTILIZACION[np.searchsorted(_BINS_UTILIZACION, utilizaciones, side='right')]
         
-        # Líneas de referencia
-        self.ax_utilizacion.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='Capacidad Máxima (100%)')
-        self.ax_utilizacion.axhline(y=85, color='orange', linestyle='--', alpha=0.7, label='Utilización Alta (85%)')
-        self.ax_utilizacion.axhline(y=70, color='green', linestyle='--', alpha=0.7, label='Utilización Óptima (70%)')
+        etiquetas_tareas = snapshot.etiquetas_tareas
         
-        # Agregar valores sobre las barras
-        for i, (barra, util) in enumerate(zip(barras, utilizaciones)):
-            altura = barra.get_height()
-            self.ax_utilizacion.text(barra.get_x() + barra.get_width()/2., altura + 1,
-                                   f'{util:.1f}%', ha='center', va='bottom', fontweight='bold')
-        
-        # Agregar información de tareas en cada barra
-        for i, (barra, est) in enumerate(zip(barras, estaciones)):
-            tareas_texto = ', '.join(est.obtener_ids_tareas())
-            if len(tareas_texto) > 15:
-                tareas_texto = tareas_texto[:12] + '...'
+        # Actualizar barras y textos existentes
+        for i, barra in enumerate(self._bars.patches):
+            texto_valor = self._bar_value_texts[i]
+            texto_tareas = self._bar_inner_texts[i]
+            
+            if i >= num_estaciones:
+                barra.set_visible(False)
+                texto_valor.set_visible(False)
+                texto_tareas.set_visible(False)
+                continue
+            
+            util = utilizaciones[i]
+            centro = barra.get_x() + barra.get_width() / 2.
             
-            # Texto dentro de la barra si hay espacio
-            if barra.get_height() > 20:
-                self.ax_utilizacion.text(barra.get_x() + barra.get_width()/2., barra.get_height()/2,
-                                       tareas_texto, ha='center', va='center', 
-                                       fontsize=8, color='white', fontweight='bold')
+            barra.set_height(util)
+            barra.set_facecolor(colores[i])
+            barra.set_visible(True)
+            
+            # Valor sobre la barra
+            texto_valor.set_position((centro, util + 1))
+            texto_valor.set_text(f'{util:.1f}%')
+            texto_valor.set_visible(True)
+            
+            # Tareas dentro de la barra si hay espacio
+            if util > 20:
+                texto_tareas.set_position((centro, util / 2))
+                texto_tareas.set_text(etiquetas_tareas[i])
+                texto_tareas.set_visible(True)
+            else:
+                texto_tareas.set_visible(False)
         
-        self.ax_utilizacion.legend(loc='upper right')
+        # Si los ejes no cambian basta con redibujar barras y textos sobre el fondo
+        layout = (tuple(numeros_estacion), max(105, float(utilizaciones.max()) * 1.1))
+        if layout == self._layout_utilizacion and self._bg_utilizacion is not None:
+            self._blit_utilizacion()
+            return
         
-        # Rotar etiquetas del eje x si hay muchas estaciones
-        if len(estaciones) > 8:
-            self.ax_utilizacion.tick_params(axis='x', rotation=45)
+        # Configurar ejes
+        self.ax_utilizacion.set_xticks(range(num_estaciones))
+        self.ax_utilizacion.set_xticklabels(numeros_estacion)
+        self.ax_utilizacion.set_xlim(-0.5, num_estaciones - 0.5)
+        self.ax_utilizacion.set_ylim(0, layout[1])
         
-        self.fig_utilizacion.tight_layout()
-        self.canvas_utilizacion.draw()
-    
-    def _actualizar_graficos_comparacion(self, estaciones: List, metricas: Dict):
-        """Actualiza los gráficos de comparación."""
-        self.fig_comparacion.clear()
+        # Rotar etiquetas del eje x si hay muchas estaciones
+        self.ax_utilizacion.tick_params(axis='x', rotation=45 if num_estaciones > 8 else 0)
         
-        # Crear subplots con mejor distribución
-        gs = self.fig_comparacion.add_gridspec(2, 2, hspace=0.4, wspace=0.3)
+        self._texto_vacio.set_visible(False)
+        self._layout_utilizacion = layout
         
+        self._programar_dibujo()
+    
+    def _dibujar_artistas_utilizacion(self):
+        """Dibuja las barras y textos animados (y las referencias y la leyenda encima) sobre el renderer actual."""
+        ax = self.ax_utilizacion
+        for barra in self._bars.patches:
+            ax.draw_artist(barra)
+        for texto in self._bar_value_texts + self._bar_inner_texts:
+            ax.draw_artist(texto)
+        ax.draw_artist(self._ref_lc)
+        ax.draw_artist(self._legend)
+    
+    def _on_draw_utilizacion(self, event):
+        """Guarda el fondo tras un dibujado completo y pinta encima los artistas animados."""
+        self._bg_utilizacion = self.canvas_utilizacion.copy_from_bbox(self.ax_utilizacion.bbox)
+        if self._bars is not None:
+            self._dibujar_artistas_utilizacion()
+    
+    def _blit_utilizacion(self):
+        """Redibuja solo la región de los ejes de utilización a partir del fondo guardado."""
+        self.canvas_utilizacion.restore_region(self._bg_utilizacion)
+        self._dibujar_artistas_utilizacion()
+        self.canvas_utilizacion.blit(self.ax_utilizacion.bbox)
+    
+    def _actualizar_graficos_comparacion(self, snapshot: InstantaneaEstaciones, metricas: Dict):
+        """Actualiza los gráficos de comparación sobre los ejes ya existentes."""
         # 1. Gráfico de barras de tiempo por estación
-        self._crear_grafico_tiempos(gs[0, 0], estaciones)
+        self._actualizar_grafico_tiempos(snapshot)
         
         # 2. Gráfico de pastel de distribución de carga
-        self._crear_grafico_pastel(gs[0, 1], estaciones)
+        self._actualizar_grafico_pastel(snapshot)
         
         # 3. Gráfico de métricas de eficiencia
-        self._crear_grafico_metricas(gs[1, 0], metricas)
+        self._actualizar_grafico_metricas(metricas)
         
         # 4. Gráfico de tareas por estación
-        self._crear_grafico_tareas(gs[1, 1], estaciones)
+        self.ax_tareas.cla()
+        self._crear_grafico_tareas(self.ax_tareas, snapshot)
         
-        self.fig_comparacion.tight_layout()
-        self.canvas_comparacion.draw()
+        self._programar_dibujo()
     
-    def _crear_grafico_tiempos(self, subplot_spec, estaciones: List):
-        """Crea el gráfico de tiempo total por estación."""
-        ax = self.fig_comparacion.add_subplot(subplot_spec)
+    def _actualizar_grafico_tiempos(self, snapshot: InstantaneaEstaciones):
+        """Actualiza el gráfico de tiempo total por estación reutilizando sus artistas."""
+        num_estaciones = len(snapshot)
+        if num_estaciones > len(self._barras_tiempos.patches):
+            self._crear_barras_tiempos(num_estaciones)
+        
+        tiempos_totales = snapshot.tiempos
+        tiempo_ciclo = snapshot.tiempo_ciclo
+        
+        for i, (barra, texto) in enumerate(zip(self._barras_tiempos.patches, self._textos_tiempos)):
+            if i >= num_estaciones:
+                barra.set_visible(False)
+                texto.set_visible(False)
+                continue
+            
+            tiempo = tiempos_totales[i]
+            barra.set_height(tiempo)
+            barra.set_visible(True)
+            
+            texto.set_position((barra.get_x() + barra.get_width()/2., tiempo + 0.5))
+            texto.set_text(f'{tiempo:.1f}')
+            texto.set_visible(True)
         
+        # Línea de referencia del tiempo de ciclo
+        if tiempo_ciclo > 0:
+            etiqueta = f'Tiempo de Ciclo ({tiempo_ciclo:.1f} min)'
+            self._linea_ciclo.set_ydata([tiempo_ciclo, tiempo_ciclo])
+            self._linea_ciclo.set_label(etiqueta)
+            self._leyenda_tiempos.get_texts()[0].set_text(etiqueta)
+        self._linea_ciclo.set_visible(tiempo_ciclo > 0)
+        self._leyenda_tiempos.set_visible(tiempo_ciclo > 0)
+        
+        # Configurar ejes
+        ax = self.ax_tiempos
+        ax.set_xticks(range(num_estaciones))
+        ax.set_xticklabels(snapshot.etiquetas_cortas)
+        ax.set_xlim(-0.5, num_estaciones - 0.5)
+        ax.set_ylim(0, max(tiempos_totales.max(), tiempo_ciclo) * 1.1 or 1)
+        
+        self._tiempos_texto_vacio.set_visible(False)
+    
+    def _crear_grafico_tiempos(self, ax, snapshot: InstantaneaEstaciones):
+        """Crea el gráfico de tiempo total por estación (para la figura de exportación)."""
         # Preparar datos
-        numeros_estacion = [f"E{est.numero}" for est in estaciones]
-        tiempos_totales = [est.tiempo_total for est in estaciones]
-        tiempo_ciclo = estaciones[0].tiempo_ciclo_max if estaciones else 0
+        numeros_estacion = snapshot.etiquetas_cortas
+        tiempos_totales = snapshot.tiempos
+        tiempo_ciclo = snapshot.tiempo_ciclo
         
         # Crear gráfico de barras
         barras = ax.bar(numeros_estacion, tiempos_totales, color=COLORES['primario'], alpha=0.7)
@@ -280,59 +693,101 @@ class PanelGraficos:
         if tiempo_ciclo > 0:
             ax.legend(fontsize=8)
     
-    def _crear_grafico_pastel(self, subplot_spec, estaciones: List):
-        """Crea el gráfico de pastel de distribución de carga."""
-        ax = self.fig_comparacion.add_subplot(subplot_spec)
+    def _actualizar_grafico_pastel(self, snapshot: InstantaneaEstaciones):
+        """
+        Actualiza el gráfico de pastel de distribución de carga.
+        Reutiliza los sectores existentes cambiando sus ángulos en lugar de
+        volver a llamar a ax.pie().
+        """
+        num_estaciones = len(snapshot)
+        tiempos = snapshot.tiempos
+        total = tiempos.sum() if num_estaciones else 0
         
-        # Preparar datos
-        labels = [f"Est. {est.numero}" for est in estaciones]
-        tiempos = [est.tiempo_total for est in estaciones]
+        # CORRECCIÓN: Validar que hay tiempos válidos
+        if total == 0:
+            self._ocultar_pastel()
+            return
         
-        # Colores personalizados
-        colores_pastel = plt.cm.Set3(range(len(estaciones)))
+        if num_estaciones > len(self._pie_wedges):
+            self._crear_sectores_pastel(num_estaciones)
         
-        # Crear gráfico de pastel
-        wedges, textos, autotextos = ax.pie(tiempos, labels=labels, autopct='%1.1f%%',
-                                           colors=colores_pastel, startangle=90)
+        # Ángulos acumulados de cada sector, empezando en 90° como ax.pie(startangle=90)
+        fracciones = tiempos / total
+        angulos = 90.0 + np.concatenate(([0.0], np.cumsum(tiempos) / total * 360.0))
+        medios = np.deg2rad((angulos[:-1] + angulos[1:]) / 2)
         
-        ax.set_title('Distribución de Carga de Trabajo', fontweight='bold', fontsize=11)
+        # Colores personalizados
+        # Más allá de la paleta se repite el último color, igual que el colormap
+        colores_pastel = np.take(_COLORES_PASTEL, np.arange(num_estaciones), axis=0, mode='clip')
+        
+        for i, (wedge, etiqueta, porcentaje) in enumerate(zip(self._pie_wedges, self._pie_labels,
+                                                               self._pie_pct_texts)):
+            if i >= num_estaciones:
+                wedge.set_visible(False)
+                etiqueta.set_visible(False)
+                porcentaje.set_visible(False)
+                continue
+            
+            wedge.set_theta1(angulos[i])
+            wedge.set_theta2(angulos[i + 1])
+            wedge.set_facecolor(colores_pastel[i])
+            wedge.set_visible(True)
+            
+            x, y = np.cos(medios[i]), np.sin(medios[i])
+            
+            etiqueta.set_position((1.1 * x, 1.1 * y))
+            etiqueta.set_horizontalalignment('left' if x > 0 else 'right')
+            etiqueta.set_text(snapshot.etiquetas_largas[i])
+            etiqueta.set_visible(True)
+            
+            porcentaje.set_position((0.6 * x, 0.6 * y))
+            porcentaje.set_text(f'{fracciones[i] * 100:.1f}%')
+            porcentaje.set_visible(True)
         
-        # Mejorar texto
-        for autotext in autotextos:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(8)
+        self._pie_texto_vacio.set_visible(False)
     
-    def _crear_grafico_metricas(self, subplot_spec, metricas: Dict):
-        """Crea el gráfico de métricas de eficiencia."""
-        ax = self.fig_comparacion.add_subplot(subplot_spec)
-        
-        # Extraer métricas
+    @staticmethod
+    def _valores_metricas(metricas: Dict) -> List[float]:
+        """Extrae los valores mostrados en el gráfico de métricas de eficiencia."""
         eficiencia_data = metricas.get('metricas_eficiencia', {})
         produccion_data = metricas.get('metricas_produccion', {})
-        
-        # Preparar datos
-        categorias = ['Eficiencia\nLínea', 'Utilización\nPromedio', 'Utilización\nCapacidad']
-        valores = [
+        return [
             eficiencia_data.get('eficiencia_linea', 0),
             eficiencia_data.get('utilizacion_promedio', 0),
             produccion_data.get('utilizacion_capacidad', 0)
         ]
+    
+    @staticmethod
+    def _colores_metricas(valores: List[float]) -> np.ndarray:
+        """Clasifica cada valor de métrica en su color (malo, regular, bueno, excelente)."""
+        return _PALETA_METRICAS[np.digitize(np.asarray(valores, dtype=np.float64), _BINS_METRICAS)]
+    
+    def _actualizar_grafico_metricas(self, metricas: Dict):
+        """Actualiza el gráfico de métricas de eficiencia reutilizando sus artistas."""
+        valores = self._valores_metricas(metricas)
+        colores_metricas = self._colores_metricas(valores)
+        
+        for barra, texto, valor, color in zip(self._barras_metricas, self._textos_metricas,
+                                              valores, colores_metricas):
+            barra.set_height(valor)
+            barra.set_facecolor(color)
+            barra.set_visible(True)
+            
+            texto.set_y(valor + 2)
+            texto.set_text(f'{valor:.1f}%')
+            texto.set_visible(True)
         
-        # Colores basados en el valor
-        colores_metricas = []
-        for valor in valores:
-            if valor >= 90:
-                colores_metricas.append('#28A745')  # Verde excelente
-            elif valor >= 80:
-                colores_metricas.append('#FFC107')  # Amarillo bueno
-            elif valor >= 70:
-                colores_metricas.append('#FD7E14')  # Naranja regular
-            else:
-                colores_metricas.append('#DC3545')  # Rojo malo
+        self._ref_lc_metricas.set_visible(True)
+        self._leyenda_metricas.set_visible(True)
+        self._metricas_texto_vacio.set_visible(False)
+    
+    def _crear_grafico_metricas(self, ax, metricas: Dict):
+        """Crea el gráfico de métricas de eficiencia (para la figura de exportación)."""
+        valores = self._valores_metricas(metricas)
+        colores_metricas = self._colores_metricas(valores)
         
         # Crear gráfico de barras
-        barras = ax.bar(categorias, valores, color=colores_metricas, alpha=0.8)
+        barras = ax.bar(_CATEGORIAS_METRICAS, valores, color=colores_metricas, alpha=0.8)
         
         # Configurar gráfico
         ax.set_title('Métricas de Eficiencia', fontweight='bold', fontsize=11)
@@ -346,29 +801,30 @@ class PanelGraficos:
                    f'{valor:.1f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
         
         # Líneas de referencia
-        ax.axhline(y=90, color='green', linestyle='--', alpha=0.5, label='Excelente (90%)')
-        ax.axhline(y=80, color='orange', linestyle='--', alpha=0.5, label='Bueno (80%)')
-        ax.axhline(y=70, color='red', linestyle='--', alpha=0.5, label='Aceptable (70%)')
+        _, manejadores = _agregar_lineas_referencia(ax, _REFERENCIAS_METRICAS, 0.5)
         
-        ax.legend(fontsize=7, loc='upper right')
+        ax.legend(handles=manejadores, fontsize=7, loc='upper right')
     
-    def _crear_grafico_tareas(self, subplot_spec, estaciones: List):
+    def _crear_grafico_tareas(self, ax, snapshot: InstantaneaEstaciones):
         """Crea el gráfico de número de tareas por estación."""
-        ax = self.fig_comparacion.add_subplot(subplot_spec)
-        
         # Preparar datos
-        numeros_estacion = [f"Est. {est.numero}" for est in estaciones]
-        num_tareas = [len(est.tareas_asignadas) for est in estaciones]
+        numeros_estacion = snapshot.etiquetas_largas
+        num_tareas = snapshot.num_tareas
         
         # CORRECCIÓN: Validar que hay datos y variación
-        if not num_tareas or max(num_tareas) == 0:
+        if len(num_tareas) == 0 or num_tareas.max() == 0:
             ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes, 
                    ha='center', va='center', alpha=0.6)
             ax.set_title('Número de Tareas por Estación', fontweight='bold', fontsize=11)
             return
         
-        # Crear gráfico de barras horizontales
-        barras = ax.barh(numeros_estacion, num_tareas, color=COLORES['secundario'], alpha=0.7)
+        # Crear gráfico de barras horizontales como una sola colección de rectángulos
+        posiciones = np.arange(len(num_tareas))
+        rectangulos = [Rectangle((0, y - 0.4), num, 0.8) for y, num in zip(posiciones, num_tareas)]
+        ax.add_collection(PatchCollection(rectangulos, facecolor=COLORES['secundario'], alpha=0.7))
+        ax.set_yticks(posiciones)
+        ax.set_yticklabels(numeros_estacion)
+        ax.set_ylim(-0.6, len(num_tareas) - 0.4)
         
         # Configurar gráfico
         ax.set_title('Número de Tareas por Estación', fontweight='bold', fontsize=11)
@@ -376,138 +832,159 @@ class PanelGraficos:
         ax.grid(True, alpha=0.3, axis='x')
         
         # Agregar valores al final de las barras
-        for barra, num in zip(barras, num_tareas):
-            ax.text(barra.get_width() + 0.1, barra.get_y() + barra.get_height()/2.,
-                   str(num), ha='left', va='center', fontsize=9, fontweight='bold')
+        for y, num in zip(posiciones, num_tareas):
+            ax.text(num + 0.1, y, str(num), ha='left', va='center', fontsize=9, fontweight='bold')
         
         # CORRECCIÓN: Ajustar límites solo si hay variación
-        max_tareas = max(num_tareas)
+        max_tareas = num_tareas.max()
         if max_tareas > 0:
             ax.set_xlim(0, max_tareas * 1.2)
         else:
             ax.set_xlim(0, 1)
     
-    def _crear_grafico_pastel(self, subplot_spec, estaciones: List):
-        """Crea el gráfico de pastel de distribución de carga."""
-        ax = self.fig_comparacion.add_subplot(subplot_spec)
-        
-        # Preparar datos
-        labels = [f"Est. {est.numero}" for est in estaciones]
-        tiempos = [est.tiempo_total for est in estaciones]
-        
-        # CORRECCIÓN: Validar que hay tiempos válidos
-        if not tiempos or sum(tiempos) == 0:
-            ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes, 
-                   ha='center', va='center', alpha=0.6)
-            ax.set_title('Distribución de Carga de Trabajo', fontweight='bold', fontsize=11)
-            return
-        
-        # Colores personalizados
-        colores_pastel = plt.cm.Set3(range(len(estaciones)))
-        
-        # Crear gráfico de pastel
-        wedges, textos, autotextos = ax.pie(tiempos, labels=labels, autopct='%1.1f%%',
-                                           colors=colores_pastel, startangle=90)
-        
-        ax.set_title('Distribución de Carga de Trabajo', fontweight='bold', fontsize=11)
-        
-        # Mejorar texto
-        for autotext in autotextos:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(8)
-    
-    def _inicializar_graficos_comparacion(self):
-        """Inicializa los gráficos de comparación vacíos."""
-        self.fig_comparacion.clear()
-        
-        # Crear subplots
-        gs = self.fig_comparacion.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
-        
-        # Gráfico de barras de tiempo por estación
-        self.ax_tiempos = self.fig_comparacion.add_subplot(gs[0, 0])
-        self.ax_tiempos.set_title('Tiempo Total por Estación', fontweight='bold')
-        self.ax_tiempos.set_xlabel('Estación')
-        self.ax_tiempos.set_ylabel('Tiempo (min)')
-        
-        # Gráfico de pastel de distribución de carga
-        self.ax_pastel = self.fig_comparacion.add_subplot(gs[0, 1])
-        self.ax_pastel.set_title('Distribución de Carga de Trabajo', fontweight='bold')
-        
-        # Gráfico de línea de eficiencia
-        self.ax_eficiencia = self.fig_comparacion.add_subplot(gs[1, 0])
-        self.ax_eficiencia.set_title('Métricas de Eficiencia', fontweight='bold')
-        self.ax_eficiencia.set_ylabel('Valor (%)')
-        
-        # Gráfico de barras horizontales de tareas por estación
-        self.ax_tareas = self.fig_comparacion.add_subplot(gs[1, 1])
-        self.ax_tareas.set_title('Número de Tareas por Estación', fontweight='bold')
-        self.ax_tareas.set_xlabel('Número de Tareas')
-        
-        # Texto informativo
-        for ax in [self.ax_tiempos, self.ax_pastel, self.ax_eficiencia, self.ax_tareas]:
-            ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes, 
-                   ha='center', va='center', alpha=0.6)
-        
-        
-        try:
-            self.fig_comparacion.tight_layout()
-        except:
-            pass 
-        
-        self.canvas_comparacion.draw()
+    def _programar_dibujo(self):
+        """
+        Programa un único redibujado de los canvas para el próximo ciclo ocioso de Tk.
+        Varias actualizaciones seguidas se agrupan en un solo render.
+        """
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.parent.after_idle(self._flush_draw)
     
-    def _actualizar_graficos_comparacion(self, estaciones: List, metricas: Dict):
-        """Actualiza los gráficos de comparación."""
-        self.fig_comparacion.clear()
-        
-        # Crear subplots con mejor distribución
-        gs = self.fig_comparacion.add_gridspec(2, 2, hspace=0.4, wspace=0.3)
-        
-        # 1. Gráfico de barras de tiempo por estación
-        self._crear_grafico_tiempos(gs[0, 0], estaciones)
-        
-        # 2. Gráfico de pastel de distribución de carga
-        self._crear_grafico_pastel(gs[0, 1], estaciones)
-        
-        # 3. Gráfico de métricas de eficiencia
-        self._crear_grafico_metricas(gs[1, 0], metricas)
-        
-        # 4. Gráfico de tareas por estación
-        self._crear_grafico_tareas(gs[1, 1], estaciones)
-        
-        # CORRECCIÓN: usar tight_layout con manejo de errores
-        try:
-            self.fig_comparacion.tight_layout()
-        except:
-            pass  # Ignorar warnings de tight_layout
-        
-        self.canvas_comparacion.draw()
+    def _flush_draw(self):
+        """Redibuja los canvas pendientes."""
+        self._pending_redraw = False
+        self.canvas_utilizacion.draw_idle()
+        if self.canvas_comparacion is not None:
+            self.canvas_comparacion.draw_idle()
     
     def limpiar_graficos(self):
         """Limpia todos los gráficos."""
+        # Descartar una actualización pendiente para que no reaparezcan datos viejos
+        if self._debounce_id is not None:
+            self.parent.after_cancel(self._debounce_id)
+            self._debounce_id = None
+            self._pending_update = None
+        
+        self._last_snapshot = None
+        self._last_metricas = None
+        self._last_key = None
         self._inicializar_grafico_utilizacion()
-        self._inicializar_graficos_comparacion()
+        if self.canvas_comparacion is not None:
+            self._inicializar_graficos_comparacion()
+    
+    def exportar_graficos(self, ruta_archivo: str,
+                          al_terminar: Optional[Callable[[bool], None]] = None) -> bool:
+        """
+        Exporta los gráficos a un archivo en segundo plano.
+        El renderizado se hace en un hilo de trabajo sobre una figura Agg
+        independiente; al terminar se llama a al_terminar(exito) desde el hilo de Tk.
+        Retorna False si no hay resultados o si ya hay una exportación en curso.
+        """
+        if self._last_snapshot is None:
+            print("Error al exportar gráficos: no hay resultados para exportar")
+            return False
+        
+        if not self._export_lock.acquire(blocking=False):
+            print("Error al exportar gráficos: ya hay una exportación en curso")
+            return False
+        
+        futuro = self._export_pool.submit(self._exportar_figura, ruta_archivo,
+                                          self._last_snapshot, self._last_metricas)
+        futuro.add_done_callback(
+            lambda f: self.parent.after(0, self._on_exportacion_terminada, f, al_terminar)
+        )
+        return True
+    
+    def _on_exportacion_terminada(self, futuro: Future, al_terminar: Optional[Callable[[bool], None]]):
+        """Libera la exportación en curso y notifica el resultado (hilo de Tk)."""
+        self._export_lock.release()
+        if al_terminar is not None:
+            al_terminar(futuro.result())
     
-    def exportar_graficos(self, ruta_archivo: str):
-        """Exporta los gráficos a un archivo."""
+    def _exportar_figura(self, ruta_archivo: str, snapshot: InstantaneaEstaciones, metricas: Dict) -> bool:
+        """
+        Dibuja y guarda la figura de exportación.
+        Se ejecuta en el hilo de trabajo: solo usa Figure y FigureCanvasAgg,
+        sin pyplot ni los canvas de Tk.
+        """
         try:
-            # Crear figura combinada para exportar
-            fig_export = plt.figure(figsize=(16, 12))
+            if self._export_canvas is None:
+                self._crear_figura_exportacion()
             
-            # Copiar gráfico de utilización
-            ax1 = fig_export.add_subplot(2, 2, (1, 2))
-            # Aquí se copiarían los datos del gráfico de utilización
+            ax_utilizacion, ax_tiempos, ax_pastel, ax_eficiencia, ax_tareas = self._export_axes
+            for ax in self._export_axes:
+                ax.cla()
             
-            # Copiar gráficos de comparación
-            # Esto requeriría guardar los datos para poder recrear los gráficos
+            self._dibujar_utilizacion_exportacion(ax_utilizacion, snapshot)
+            self._crear_grafico_tiempos(ax_tiempos, snapshot)
+            self._dibujar_pastel_exportacion(ax_pastel, snapshot)
+            self._crear_grafico_metricas(ax_eficiencia, metricas)
+            self._crear_grafico_tareas(ax_tareas, snapshot)
             
-            fig_export.suptitle('Análisis de Balanceamiento de Línea - Algoritmo RPW', fontsize=16, fontweight='bold')
-            fig_export.tight_layout()
-            fig_export.savefig(ruta_archivo, dpi=300, bbox_inches='tight')
-            plt.close(fig_export)
+            self._export_canvas.print_figure(ruta_archivo, dpi=300, bbox_inches='tight')
             
             return True
         except Exception as e:
             print(f"Error al exportar gráficos: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _crear_figura_exportacion(self):
+        """
+        Crea la figura de exportación con su canvas Agg y sus ejes.
+        Se conserva entre exportaciones; cada exportación solo limpia los ejes.
+        """
+        fig_export = Figure(figsize=(16, 12), facecolor=COLORES['superficie'], layout='constrained')
+        self._export_canvas = FigureCanvasAgg(fig_export)
+        
+        # Utilización arriba a todo el ancho y los cuatro gráficos de comparación debajo
+        gs = fig_export.add_gridspec(3, 2)
+        self._export_axes = (
+            fig_export.add_subplot(gs[0, :]),
+            fig_export.add_subplot(gs[1, 0]),
+            fig_export.add_subplot(gs[1, 1]),
+            fig_export.add_subplot(gs[2, 0]),
+            fig_export.add_subplot(gs[2, 1])
+        )
+        
+        fig_export.suptitle('Análisis de Balanceamiento de Línea - Algoritmo RPW', fontsize=16, fontweight='bold')
+    
+    def _dibujar_utilizacion_exportacion(self, ax, snapshot: InstantaneaEstaciones):
+        """Dibuja el gráfico de utilización con artistas nuevos (para la figura de exportación)."""
+        utilizaciones = snapshot.utilizaciones
+        posiciones = np.arange(len(snapshot))
+        colores = _PALETA_UTILIZACION[np.searchsorted(_BINS_UTILIZACION, utilizaciones, side='right')]
+        
+        ax.bar(posiciones, utilizaciones, color=colores, alpha=0.8, edgecolor='white', linewidth=1)
+        for x, util, etiqueta in zip(posiciones, utilizaciones, snapshot.etiquetas_tareas):
+            ax.text(x, util + 1, f'{util:.1f}%', ha='center', va='bottom', fontweight='bold')
+            if util > 20:
+                ax.text(x, util / 2, etiqueta, ha='center', va='center', fontsize=8,
+                        color='white', fontweight='bold')
+        
+        _, manejadores = _agregar_lineas_referencia(ax, _REFERENCIAS_UTILIZACION, 0.7)
+        
+        ax.set_title('Utilización por Estación', fontsize=14, fontweight='bold')
+        ax.set_xlabel('Estación', fontsize=12)
+        ax.set_ylabel('Utilización (%)', fontsize=12)
+        ax.set_xticks(posiciones)
+        ax.set_xticklabels(snapshot.etiquetas_largas, rotation=45 if len(snapshot) > 8 else 0)
+        ax.set_ylim(0, max(105, utilizaciones.max() * 1.1))
+        ax.grid(True, alpha=0.3)
+        ax.legend(handles=manejadores, loc='upper right')
+    
+    def _dibujar_pastel_exportacion(self, ax, snapshot: InstantaneaEstaciones):
+        """Dibuja el gráfico de pastel con ax.pie (para la figura de exportación)."""
+        ax.set_title('Distribución de Carga de Trabajo', fontweight='bold', fontsize=11)
+        if snapshot.tiempos.sum() == 0:
+            ax.text(0.5, 0.5, 'Sin datos', transform=ax.transAxes,
+                   ha='center', va='center', alpha=0.6)
+            return
+        
+        colores_pastel = np.take(_COLORES_PASTEL, np.arange(len(snapshot)), axis=0, mode='clip')
+        _, _, autotextos = ax.pie(snapshot.tiempos, labels=snapshot.etiquetas_largas, autopct='%1.1f%%',
+                                  colors=colores_pastel, startangle=90)
+        for autotext in autotextos:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+            autotext.set_fontsize(8)
@@ -1,7 +1,104 @@
-import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
+from bisect import bisect_right
+from string import Template
+from types import MappingProxyType
 from typing import Dict, List
 from utils.estilos import EstilosModernos, COLORES, FUENTES, ESPACIADO, UtilsUI
+from .tabla_virtual import TablaVirtual
+
+
+# Estado de cada estación según su utilización (%): el umbral i marca el inicio de _ESTADOS[i + 1]
+_UMBRALES_ESTADO = (70, 85, 98)
+_ESTADOS = ("🔵 Baja Carga", "🟢 Óptima", "🟡 Alta Carga", "🔴 Cuello Botella")
+
+# Interpretación de la eficiencia de línea y de la utilización promedio (%)
+_UMBRALES_EFICIENCIA = (70, 80, 90)
+_INTERPRETACIONES_EFICIENCIA = (
+    "• Eficiencia baja (<70%): Requiere rediseño del balanceamiento.\n",
+    "• Eficiencia regular (70-79%): Se recomienda rebalancear.\n",
+    "• Eficiencia buena (80-89%): Hay margen de mejora moderado.\n",
+    "• Eficiencia excelente (≥90%): La línea está muy bien balanceada.\n"
+)
+_UMBRALES_UTILIZACION = (70, 85)
+_INTERPRETACIONES_UTILIZACION = (
+    "• Utilización baja: Considere reducir estaciones.\n",
+    "• Utilización moderada: Aceptable pero mejorable.\n",
+    "• Utilización alta: Las estaciones están bien aprovechadas.\n"
+)
+
+# Plantilla del texto de recomendaciones
+_PLANTILLA_RECOMENDACIONES = Template(
+    "📋 RECOMENDACIONES DE MEJORA:\n\n"
+    "${lista}"
+    "📊 INTERPRETACIÓN DE MÉTRICAS:\n\n"
+    "${eficiencia}${utilizacion}"
+)
+
+# Formateadores precompilados para los valores numéricos
+_FMT_0 = "%.0f".__mod__
+_FMT_1 = "%.1f".__mod__
+_FMT_2 = "%.2f".__mod__
+_FMT_3 = "%.3f".__mod__
+_FMT_PORCENTAJE = "%.1f%%".__mod__
+_FMT_ESTACION = "Est. %s".__mod__
+
+# Métricas principales: (clave del label y de la métrica, categoría, formateador)
+_METRICAS_PRINCIPALES = (
+    ('numero_estaciones', 'metricas_basicas', str),
+    ('tiempo_ciclo', 'metricas_basicas', _FMT_2),
+    ('eficiencia_linea', 'metricas_eficiencia', _FMT_1),
+    ('utilizacion_promedio', 'metricas_eficiencia', _FMT_1),
+    ('throughput_real', 'metricas_produccion', _FMT_3),
+    ('capacidad_diaria', 'metricas_produccion', _FMT_0),
+    ('tiempo_ocioso_total', 'metricas_eficiencia', _FMT_1),
+    ('desbalance', 'metricas_eficiencia', _FMT_1)
+)
+
+# Columnas de la tabla de estaciones:
+# (id, encabezado, ancho mínimo, contenido más ancho esperado, alineación, se estira)
+_COLUMNAS_ESTACIONES = (
+    ('Estacion', 'Estación', 80, 'Est. 999', 'center', False),
+    ('Tareas', 'Tareas Asignadas', 150, 'T100, T101, T102, T103...', 'w', True),
+    ('Tiempo_Total', 'Tiempo Total (min)', 120, '9999.9', 'center', False),
+    ('Utilizacion', 'Utilización (%)', 100, '100.0%', 'center', False),
+    ('Tiempo_Ocioso', 'Tiempo Ocioso (min)', 120, '9999.9', 'center', False),
+    ('Estado', 'Estado', 100, '🔴 Cuello Botella', 'center', False)
+)
+
+# Margen (px) que se suma al texto medido para el ancho de una columna
+_MARGEN_COLUMNA = 16
+
+# Filas fijas de la tabla de métricas detalladas: (métrica, descripción)
+_METRICAS_DETALLE = (
+    ("Estaciones Mínimas Teóricas", "Número mínimo de estaciones según teoría"),
+    ("Utilización Máxima", "Mayor utilización entre todas las estaciones"),
+    ("Utilización Mínima", "Menor utilización entre todas las estaciones"),
+    ("Tiempo Ocioso Porcentual", "Porcentaje total de tiempo improductivo"),
+    ("Throughput Teórico", "Unidades por minuto (teórico)"),
+    ("Utilización de Capacidad", "Porcentaje de capacidad utilizada vs demanda")
+)
+
+# Diccionario vacío compartido (de solo lectura) para categorías de métricas ausentes
+_VACIO = MappingProxyType({})
+
+
+def _resumir_ids_tareas(ids_tareas: List[str], limite: int = 25) -> str:
+    """
+    Une los IDs de tareas con ", " truncando a `limite` caracteres ("..." al final).
+    Deja de unir IDs en cuanto se supera el límite, así el trabajo no crece
+    con el número de tareas de la estación.
+    """
+    partes = []
+    longitud = -2  # El primer ID no lleva separador
+    for id_tarea in ids_tareas:
+        partes.append(id_tarea)
+        longitud += len(id_tarea) + 2
+        if longitud > limite:
+            break
+    
+    texto = ", ".join(partes)
+    return texto if len(texto) <= limite else texto[:limite - 3] + "..."
 
 
 class PanelResultados:
@@ -12,9 +109,25 @@ class PanelResultados:
     def __init__(self, parent):
         self.parent = parent
         self.frame_principal = None
+        self.tabla_estaciones = None
         self.tree_estaciones = None
         self.tree_metricas = None
         self.text_recomendaciones = None
+        self.labels_metricas = {}
+        self.labels_calidad = {}
+        self.notebook = None
+        self.frame_metricas = None
+        self.frame_recomendaciones = None
+        self._ultimas_metricas = None  # Métricas a mostrar cuando se construya una pestaña
+        self._ultima_huella = None  # Huella de los últimos resultados mostrados
+        self._fuente_celdas = None  # Fuentes para medir columnas (se crean al primer uso)
+        self._fuente_encabezados = None
+        
+        self._texto_recomendaciones_actual = None  # Texto mostrado en recomendaciones
+        self._textos_pendientes = {}  # Label -> texto, aplicados juntos en el próximo ciclo ocioso
+        
+        # Estilos registrados una sola vez aunque se creen varios paneles
+        EstilosModernos.asegurar_tema_principal()
         
         self._crear_interfaz()
     
@@ -24,6 +137,10 @@ class PanelResultados:
         card_frame, shadow_frame = EstilosModernos.crear_frame_card(self.parent, ESPACIADO['normal'])
         self.frame_principal = card_frame
         
+        # Empaquetar frame principal antes de crear los hijos (una sola pasada de geometría)
+        shadow_frame.pack(fill='both', expand=True, padx=2, pady=2)
+        card_frame.pack(fill='both', expand=True)
+        
         # Título del panel
         titulo = ttk.Label(self.frame_principal, 
                           text="📊 Resultados del Balanceamiento", 
@@ -31,21 +148,16 @@ class PanelResultados:
         titulo.pack(anchor='w', pady=(0, ESPACIADO['normal']))
         
         # Crear notebook para organizar resultados
-        notebook = ttk.Notebook(self.frame_principal)
-        notebook.pack(fill='both', expand=True)
+        self.notebook = ttk.Notebook(self.frame_principal)
+        self.notebook.pack(fill='both', expand=True)
         
         # Pestaña de asignaciones
-        self._crear_pestana_asignaciones(notebook)
-        
-        # Pestaña de métricas
-        self._crear_pestana_metricas(notebook)
-        
-        # Pestaña de recomendaciones
-        self._crear_pestana_recomendaciones(notebook)
+        self._crear_pestana_asignaciones(self.notebook)
         
-        # Empaquetar frame principal
-        shadow_frame.pack(fill='both', expand=True, padx=2, pady=2)
-        card_frame.pack(fill='both', expand=True)
+        # Pestañas de métricas y recomendaciones (su contenido se crea al visitarlas)
+        self._crear_pestana_metricas(self.notebook)
+        self._crear_pestana_recomendaciones(self.notebook)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
     def _crear_pestana_asignaciones(self, notebook):
         """Crea la pestaña de asignaciones por estación."""
@@ -65,44 +177,55 @@ class PanelResultados:
         frame_tree = ttk.Frame(parent)
         frame_tree.pack(fill='both', expand=True)
         
-        # Crear Treeview
-        columnas = ('Estacion', 'Tareas', 'Tiempo_Total', 'Utilizacion', 'Tiempo_Ocioso', 'Estado')
-        self.tree_estaciones = ttk.Treeview(frame_tree, columns=columnas, show='headings', height=10)
+        # Tabla virtualizada: con muchas estaciones solo se insertan las filas visibles
+        columnas = [(columna, encabezado, ancho_minimo)
+                    for columna, encabezado, ancho_minimo, _, _, _ in _COLUMNAS_ESTACIONES]
+        self.tabla_estaciones = TablaVirtual(frame_tree, columnas, altura=10)
+        self.tree_estaciones = self.tabla_estaciones.tree
+        self.tree_estaciones.configure(displaycolumns=tuple(col[0] for col in _COLUMNAS_ESTACIONES))
         
-        # Configurar columnas
-        self.tree_estaciones.heading('Estacion', text='Estación')
-        self.tree_estaciones.heading('Tareas', text='Tareas Asignadas')
-        self.tree_estaciones.heading('Tiempo_Total', text='Tiempo Total (min)')
-        self.tree_estaciones.heading('Utilizacion', text='Utilización (%)')
-        self.tree_estaciones.heading('Tiempo_Ocioso', text='Tiempo Ocioso (min)')
-        self.tree_estaciones.heading('Estado', text='Estado')
-        
-        # Ajustar ancho de columnas
-        self.tree_estaciones.column('Estacion', width=80, anchor='center')
-        self.tree_estaciones.column('Tareas', width=150)
-        self.tree_estaciones.column('Tiempo_Total', width=120, anchor='center')
-        self.tree_estaciones.column('Utilizacion', width=100, anchor='center')
-        self.tree_estaciones.column('Tiempo_Ocioso', width=120, anchor='center')
-        self.tree_estaciones.column('Estado', width=100, anchor='center')
-        
-        # Scrollbars
-        scrollbar_v = ttk.Scrollbar(frame_tree, orient='vertical', command=self.tree_estaciones.yview)
+        # Anchos fijos medidos una sola vez (solo la columna de tareas se estira)
+        for columna, encabezado, ancho_minimo, muestra, alineacion, estirar in _COLUMNAS_ESTACIONES:
+            ancho = self._medir_ancho_columna(encabezado, [muestra], ancho_minimo)
+            self.tree_estaciones.column(columna, width=ancho, minwidth=ancho, anchor=alineacion, stretch=estirar)
+        
+        # Scrollbar horizontal (la vertical la gestiona la tabla virtual)
         scrollbar_h = ttk.Scrollbar(frame_tree, orient='horizontal', command=self.tree_estaciones.xview)
-        self.tree_estaciones.configure(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
+        self.tree_estaciones.configure(xscrollcommand=scrollbar_h.set)
         
         # Empaquetar tabla y scrollbars
         self.tree_estaciones.grid(row=0, column=0, sticky='nsew')
-        scrollbar_v.grid(row=0, column=1, sticky='ns')
+        self.tabla_estaciones.scrollbar.grid(row=0, column=1, sticky='ns')
         scrollbar_h.grid(row=1, column=0, sticky='ew')
         
         # Configurar grid
         frame_tree.grid_rowconfigure(0, weight=1)
         frame_tree.grid_columnconfigure(0, weight=1)
     
+    def _medir_ancho_columna(self, encabezado: str, muestras: List[str], ancho_minimo: int) -> int:
+        """
+        Calcula el ancho de una columna midiendo su encabezado y contenido con
+        las fuentes de la tabla. Las fuentes se crean una sola vez por panel.
+        """
+        if self._fuente_celdas is None:
+            self._fuente_celdas = tkfont.Font(root=self.parent, font=FUENTES['normal'])
+            self._fuente_encabezados = tkfont.Font(root=self.parent, font=FUENTES['subtitulo'])
+        
+        ancho_texto = max([self._fuente_encabezados.measure(encabezado)] +
+                          [self._fuente_celdas.measure(muestra) for muestra in muestras])
+        return max(ancho_minimo, ancho_texto + _MARGEN_COLUMNA)
+    
     def _crear_pestana_metricas(self, notebook):
-        """Crea la pestaña de métricas de rendimiento."""
-        frame_metricas = ttk.Frame(notebook, style='Superficie.TFrame', padding=ESPACIADO['normal'])
-        notebook.add(frame_metricas, text='📈 Métricas')
+        """
+        Crea la pestaña de métricas de rendimiento.
+        Solo se agrega el frame vacío; el contenido se construye en la primera visita.
+        """
+        self.frame_metricas = ttk.Frame(notebook, style='Superficie.TFrame', padding=ESPACIADO['normal'])
+        notebook.add(self.frame_metricas, text='📈 Métricas')
+    
+    def _construir_pestana_metricas(self):
+        """Construye el contenido de la pestaña de métricas."""
+        frame_metricas = self.frame_metricas
         
         # Frame superior para métricas principales
         frame_principales = ttk.LabelFrame(frame_metricas, text="Métricas Principales", padding=ESPACIADO['normal'])
@@ -163,23 +286,38 @@ class PanelResultados:
         self.tree_metricas.heading('Valor', text='Valor')
         self.tree_metricas.heading('Descripcion', text='Descripción')
         
-        # Ajustar ancho de columnas
-        self.tree_metricas.column('Metrica', width=200)
+        # Ajustar ancho de columnas al contenido fijo, medido una sola vez
+        nombres = [metrica for metrica, _ in _METRICAS_DETALLE]
+        descripciones = [descripcion for _, descripcion in _METRICAS_DETALLE]
+        self.tree_metricas.column('Metrica', width=self._medir_ancho_columna('Métrica', nombres, 200))
         self.tree_metricas.column('Valor', width=100, anchor='center')
-        self.tree_metricas.column('Descripcion', width=300)
+        self.tree_metricas.column('Descripcion', width=self._medir_ancho_columna('Descripción', descripciones, 300))
         
         # Scrollbar
-        scrollbar_metricas = ttk.Scrollbar(frame_tree, orient='vertical', command=self.tree_metricas.yview)
-        self.tree_metricas.configure(yscrollcommand=scrollbar_metricas.set)
+        self.scrollbar_metricas = ttk.Scrollbar(frame_tree, orient='vertical', command=self.tree_metricas.yview)
+        self.tree_metricas.configure(yscrollcommand=self.scrollbar_metricas.set)
         
         # Empaquetar
         self.tree_metricas.pack(side='left', fill='both', expand=True)
-        scrollbar_metricas.pack(side='right', fill='y')
+        self.scrollbar_metricas.pack(side='right', fill='y')
+        
+        # Filas fijas: en cada actualización solo cambia la columna de valor
+        self._iids_metricas = [
+            self.tree_metricas.insert('', 'end', values=(metrica, "--", descripcion))
+            for metrica, descripcion in _METRICAS_DETALLE
+        ]
     
     def _crear_pestana_recomendaciones(self, notebook):
-        """Crea la pestaña de recomendaciones."""
-        frame_recomendaciones = ttk.Frame(notebook, style='Superficie.TFrame', padding=ESPACIADO['normal'])
-        notebook.add(frame_recomendaciones, text='💡 Recomendaciones')
+        """
+        Crea la pestaña de recomendaciones.
+        Solo se agrega el frame vacío; el contenido se construye en la primera visita.
+        """
+        self.frame_recomendaciones = ttk.Frame(notebook, style='Superficie.TFrame', padding=ESPACIADO['normal'])
+        notebook.add(self.frame_recomendaciones, text='💡 Recomendaciones')
+    
+    def _construir_pestana_recomendaciones(self):
+        """Construye el contenido de la pestaña de recomendaciones."""
+        frame_recomendaciones = self.frame_recomendaciones
         
         # Frame para indicadores de calidad
         frame_calidad = ttk.LabelFrame(frame_recomendaciones, text="Indicadores de Calidad", padding=ESPACIADO['normal'])
@@ -220,69 +358,101 @@ class PanelResultados:
             self.labels_calidad[clave] = label_valor
     
     def _crear_area_recomendaciones(self, parent):
-        """Crea el área de texto para recomendaciones."""
-        # Frame para texto con scrollbar
-        frame_texto = ttk.Frame(parent)
-        frame_texto.pack(fill='both', expand=True)
-        
-        # Text widget para recomendaciones
-        self.text_recomendaciones = tk.Text(frame_texto, 
-                                           height=8,
-                                           font=FUENTES['normal'],
-                                           bg=COLORES['superficie'],
-                                           fg=COLORES['texto_primario'],
-                                           wrap=tk.WORD,
-                                           state='disabled')
-        
-        # Scrollbar para texto
-        scrollbar_texto = ttk.Scrollbar(frame_texto, orient='vertical', command=self.text_recomendaciones.yview)
-        self.text_recomendaciones.configure(yscrollcommand=scrollbar_texto.set)
-        
-        # Empaquetar
-        self.text_recomendaciones.pack(side='left', fill='both', expand=True)
-        scrollbar_texto.pack(side='right', fill='y')
+        """
+        Crea el área de texto para recomendaciones.
+        Es de solo lectura y de contenido acotado, así que basta un Label con ajuste de línea.
+        """
+        self.text_recomendaciones = ttk.Label(parent,
+                                              font=FUENTES['normal'],
+                                              background=COLORES['superficie'],
+                                              foreground=COLORES['texto_primario'],
+                                              wraplength=600,
+                                              justify='left',
+                                              anchor='nw')
+        self.text_recomendaciones.pack(fill='both', expand=True)
+        
+        # Ajustar el ancho de línea al ancho disponible
+        self.text_recomendaciones.bind(
+            '<Configure>', lambda e: self.text_recomendaciones.config(wraplength=max(e.width - 10, 100))
+        )
+    
+    def _on_tab_changed(self, event):
+        """Construye la pestaña seleccionada la primera vez y le aplica los últimos resultados."""
+        seleccion = self.notebook.select()
+        
+        if seleccion == str(self.frame_metricas) and self.tree_metricas is None:
+            self._construir_pestana_metricas()
+            if self._ultimas_metricas:
+                self._actualizar_metricas(self._ultimas_metricas)
+        elif seleccion == str(self.frame_recomendaciones) and self.text_recomendaciones is None:
+            self._construir_pestana_recomendaciones()
+            if self._ultimas_metricas:
+                self._actualizar_recomendaciones(self._ultimas_metricas)
+            else:
+                self._establecer_texto_recomendaciones("Ejecute el balanceamiento para ver recomendaciones.")
     
     def actualizar_resultados(self, estaciones: List, metricas: Dict):
-        """Actualiza todos los resultados mostrados."""
+        """
+        Actualiza todos los resultados mostrados.
+        Las pestañas aún no construidas reciben los datos cuando se visitan.
+        Si los datos son iguales a los ya mostrados no se hace nada.
+        """
+        huella = self._calcular_huella(estaciones, metricas)
+        if huella == self._ultima_huella:
+            return
+        self._ultima_huella = huella
+        
+        self._ultimas_metricas = metricas
         self._actualizar_tabla_estaciones(estaciones, metricas)
-        self._actualizar_metricas(metricas)
-        self._actualizar_recomendaciones(metricas)
+        if self.tree_metricas is not None:
+            self._actualizar_metricas(metricas)
+        if self.text_recomendaciones is not None:
+            self._actualizar_recomendaciones(metricas)
+    
+    @staticmethod
+    def _calcular_huella(estaciones: List, metricas: Dict) -> int:
+        """
+        Calcula una huella del contenido de los resultados.
+        Se basa en los valores (no en la identidad de los objetos) para que
+        listas o diccionarios reconstruidos con los mismos datos coincidan.
+        """
+        datos_estaciones = tuple(
+            (est.numero, est.tiempo_total, est.tiempo_ciclo_max, tuple(est.obtener_ids_tareas()))
+            for est in estaciones or ()
+        )
+        return hash((datos_estaciones, repr(metricas)))
     
     def _actualizar_tabla_estaciones(self, estaciones: List, metricas: Dict):
         """Actualiza la tabla de estaciones."""
-        # Limpiar tabla
-        for item in self.tree_estaciones.get_children():
-            self.tree_estaciones.delete(item)
-        
         if not estaciones:
+            self.tabla_estaciones.limpiar()
             return
         
-        # Agregar datos de estaciones
+        # Preparar todas las filas antes de tocar la tabla
+        filas = []
         for estacion in estaciones:
-            # Determinar estado de la estación
+            # Consultar una sola vez los valores derivados de la estación
             utilizacion = estacion.calcular_utilizacion()
-            if utilizacion >= 98:
-                estado = "🔴 Cuello Botella"
-            elif utilizacion >= 85:
-                estado = "🟡 Alta Carga"
-            elif utilizacion >= 70:
-                estado = "🟢 Óptima"
-            else:
-                estado = "🔵 Baja Carga"
+            ids_tareas = estacion.obtener_ids_tareas()
+            tiempo_ocioso = estacion.obtener_tiempo_ocioso()
+            
+            # Determinar estado de la estación
+            estado = _ESTADOS[bisect_right(_UMBRALES_ESTADO, utilizacion)]
             
             # Formatear tareas asignadas
-            tareas_str = ", ".join(estacion.obtener_ids_tareas())
-            if len(tareas_str) > 25:
-                tareas_str = tareas_str[:22] + "..."
+            tareas_str = _resumir_ids_tareas(ids_tareas)
             
-            self.tree_estaciones.insert('', 'end', values=(
-                f"Est. {estacion.numero}",
+            filas.append((
+                _FMT_ESTACION(estacion.numero),
                 tareas_str,
-                f"{estacion.tiempo_total:.1f}",
-                f"{utilizacion:.1f}%",
-                f"{estacion.obtener_tiempo_ocioso():.1f}",
+                _FMT_1(estacion.tiempo_total),
+                _FMT_PORCENTAJE(utilizacion),
+                _FMT_1(tiempo_ocioso),
                 estado
             ))
+        
+        # La tabla virtual inserta solo las filas visibles
+        self.tabla_estaciones.establecer_filas(filas)
     
     def _actualizar_metricas(self, metricas: Dict):
         """Actualiza las métricas mostradas."""
@@ -290,64 +460,63 @@ class PanelResultados:
             return
         
         # Extraer métricas de diferentes categorías
-        basicas = metricas.get('metricas_basicas', {})
-        eficiencia = metricas.get('metricas_eficiencia', {})
-        produccion = metricas.get('metricas_produccion', {})
-        
-        # Actualizar labels de métricas principales
-        actualizaciones = {
-            'numero_estaciones': basicas.get('numero_estaciones', 0),
-            'tiempo_ciclo': f"{basicas.get('tiempo_ciclo', 0):.2f}",
-            'eficiencia_linea': f"{eficiencia.get('eficiencia_linea', 0):.1f}",
-            'utilizacion_promedio': f"{eficiencia.get('utilizacion_promedio', 0):.1f}",
-            'throughput_real': f"{produccion.get('throughput_real', 0):.3f}",
-            'capacidad_diaria': f"{produccion.get('capacidad_diaria', 0):.0f}",
-            'tiempo_ocioso_total': f"{eficiencia.get('tiempo_ocioso_total', 0):.1f}",
-            'desbalance': f"{eficiencia.get('desbalance', 0):.1f}"
+        categorias = {
+            categoria: metricas.get(categoria) or _VACIO
+            for categoria in ('metricas_basicas', 'metricas_eficiencia', 'metricas_produccion')
         }
         
-        for clave, valor in actualizaciones.items():
+        # Actualizar labels de métricas principales
+        for clave, categoria, formatear in _METRICAS_PRINCIPALES:
             if clave in self.labels_metricas:
-                self.labels_metricas[clave].config(text=str(valor))
+                valor = categorias[categoria].get(clave, 0)
+                self._programar_texto_label(self.labels_metricas[clave], formatear(valor))
         
         # Actualizar tabla de métricas detalladas
         self._actualizar_tabla_metricas_detalladas(metricas)
     
+    def _programar_texto_label(self, label, texto: str):
+        """
+        Encola el texto de un label para aplicarlo junto con los demás en el
+        próximo ciclo ocioso. Si el label ya tenía un texto pendiente, gana el último.
+        """
+        if not self._textos_pendientes:
+            self.parent.after_idle(self._aplicar_textos_pendientes)
+        self._textos_pendientes[label] = texto
+    
+    def _aplicar_textos_pendientes(self):
+        """Aplica de una vez todos los textos de labels pendientes."""
+        pendientes, self._textos_pendientes = self._textos_pendientes, {}
+        for label, texto in pendientes.items():
+            label.config(text=texto)
+    
     def _actualizar_tabla_metricas_detalladas(self, metricas: Dict):
-        """Actualiza la tabla de métricas detalladas."""
-        # Limpiar tabla
-        for item in self.tree_metricas.get_children():
-            self.tree_metricas.delete(item)
-        
-        # Preparar datos para mostrar
-        metricas_detalle = [
-            ("Estaciones Mínimas Teóricas", 
-             metricas.get('metricas_basicas', {}).get('numero_estaciones_minimo_teorico', 0),
-             "Número mínimo de estaciones según teoría"),
-            ("Utilización Máxima", 
-             f"{metricas.get('metricas_eficiencia', {}).get('utilizacion_maxima', 0):.1f}%",
-             "Mayor utilización entre todas las estaciones"),
-            ("Utilización Mínima", 
-             f"{metricas.get('metricas_eficiencia', {}).get('utilizacion_minima', 0):.1f}%",
-             "Menor utilización entre todas las estaciones"),
-            ("Tiempo Ocioso Porcentual", 
-             f"{metricas.get('metricas_eficiencia', {}).get('tiempo_ocioso_porcentaje', 0):.1f}%",
-             "Porcentaje total de tiempo improductivo"),
-            ("Throughput Teórico", 
-             f"{metricas.get('metricas_produccion', {}).get('throughput_teorico', 0):.3f}",
-             "Unidades por minuto (teórico)"),
-            ("Utilización de Capacidad", 
-             f"{metricas.get('metricas_produccion', {}).get('utilizacion_capacidad', 0):.1f}%",
-             "Porcentaje de capacidad utilizada vs demanda")
-        ]
-        
-        # Agregar métricas a la tabla
-        for metrica, valor, descripcion in metricas_detalle:
-            self.tree_metricas.insert('', 'end', values=(metrica, valor, descripcion))
+        """Actualiza la tabla de métricas detalladas sobre sus filas existentes."""
+        # Extraer cada categoría una sola vez
+        basicas = metricas.get('metricas_basicas') or _VACIO
+        eficiencia = metricas.get('metricas_eficiencia') or _VACIO
+        produccion = metricas.get('metricas_produccion') or _VACIO
+        
+        # Preparar valores en el mismo orden que _METRICAS_DETALLE
+        valores = (
+            basicas.get('numero_estaciones_minimo_teorico', 0),
+            f"{eficiencia.get('utilizacion_maxima', 0):.1f}%",
+            f"{eficiencia.get('utilizacion_minima', 0):.1f}%",
+            f"{eficiencia.get('tiempo_ocioso_porcentaje', 0):.1f}%",
+            f"{produccion.get('throughput_teorico', 0):.3f}",
+            f"{produccion.get('utilizacion_capacidad', 0):.1f}%"
+        )
+        
+        self._establecer_valores_metricas(valores)
+    
+    def _establecer_valores_metricas(self, valores):
+        """Actualiza en su lugar la columna de valor de la tabla de métricas detalladas."""
+        for iid, (metrica, descripcion), valor in zip(self._iids_metricas, _METRICAS_DETALLE, valores):
+            self.tree_metricas.item(iid, values=(metrica, valor, descripcion))
     
     def _actualizar_recomendaciones(self, metricas: Dict):
         """Actualiza los indicadores de calidad y recomendaciones."""
-        calidad = metricas.get('indicadores_calidad', {})
+        calidad = metricas.get('indicadores_calidad') or _VACIO
+        eficiencia = metricas.get('metricas_eficiencia') or _VACIO
         
         # Actualizar indicadores de calidad
         actualizaciones_calidad = {
@@ -359,65 +528,54 @@ class PanelResultados:
         
         for clave, valor in actualizaciones_calidad.items():
             if clave in self.labels_calidad:
-                self.labels_calidad[clave].config(text=str(valor))
+                self._programar_texto_label(self.labels_calidad[clave], str(valor))
         
         # Actualizar recomendaciones
         recomendaciones = calidad.get('recomendaciones', [])
         
-        self.text_recomendaciones.config(state='normal')
-        self.text_recomendaciones.delete(1.0, tk.END)
-        
         if recomendaciones:
-            texto_recomendaciones = "📋 RECOMENDACIONES DE MEJORA:\n\n"
-            for i, rec in enumerate(recomendaciones, 1):
-                texto_recomendaciones += f"{i}. {rec}\n\n"
-            
-            # Agregar interpretación de métricas
-            texto_recomendaciones += "📊 INTERPRETACIÓN DE MÉTRICAS:\n\n"
+            eficiencia_linea = eficiencia.get('eficiencia_linea', 0)
+            utilizacion_promedio = eficiencia.get('utilizacion_promedio', 0)
             
-            eficiencia_linea = metricas.get('metricas_eficiencia', {}).get('eficiencia_linea', 0)
-            if eficiencia_linea >= 90:
-                texto_recomendaciones += "• Eficiencia excelente (≥90%): La línea está muy bien balanceada.\n"
-            elif eficiencia_linea >= 80:
-                texto_recomendaciones += "• Eficiencia buena (80-89%): Hay margen de mejora moderado.\n"
-            elif eficiencia_linea >= 70:
-                texto_recomendaciones += "• Eficiencia regular (70-79%): Se recomienda rebalancear.\n"
-            else:
-                texto_recomendaciones += "• Eficiencia baja (<70%): Requiere rediseño del balanceamiento.\n"
-            
-            utilizacion_promedio = metricas.get('metricas_eficiencia', {}).get('utilizacion_promedio', 0)
-            if utilizacion_promedio >= 85:
-                texto_recomendaciones += "• Utilización alta: Las estaciones están bien aprovechadas.\n"
-            elif utilizacion_promedio >= 70:
-                texto_recomendaciones += "• Utilización moderada: Aceptable pero mejorable.\n"
-            else:
-                texto_recomendaciones += "• Utilización baja: Considere reducir estaciones.\n"
+            # Completar la plantilla con la lista y la interpretación de métricas
+            texto_recomendaciones = _PLANTILLA_RECOMENDACIONES.substitute(
+                lista="".join(f"{i}. {rec}\n\n" for i, rec in enumerate(recomendaciones, 1)),
+                eficiencia=_INTERPRETACIONES_EFICIENCIA[bisect_right(_UMBRALES_EFICIENCIA, eficiencia_linea)],
+                utilizacion=_INTERPRETACIONES_UTILIZACION[bisect_right(_UMBRALES_UTILIZACION, utilizacion_promedio)]
+            )
         else:
             texto_recomendaciones = "No hay datos suficientes para generar recomendaciones."
         
-        self.text_recomendaciones.insert(1.0, texto_recomendaciones)
-        self.text_recomendaciones.config(state='disabled')
+        self._establecer_texto_recomendaciones(texto_recomendaciones)
+    
+    def _establecer_texto_recomendaciones(self, texto: str):
+        """Reemplaza el texto de recomendaciones solo si cambió."""
+        if texto == self._texto_recomendaciones_actual:
+            return
+        
+        self.text_recomendaciones.config(text=texto)
+        self._texto_recomendaciones_actual = texto
     
     def limpiar_resultados(self):
         """Limpia todos los resultados mostrados."""
         # Limpiar tabla de estaciones
-        for item in self.tree_estaciones.get_children():
-            self.tree_estaciones.delete(item)
+        self.tabla_estaciones.limpiar()
+        
+        self._ultimas_metricas = None
+        self._ultima_huella = None
         
-        # Limpiar tabla de métricas
-        for item in self.tree_metricas.get_children():
-            self.tree_metricas.delete(item)
+        # Limpiar valores de la tabla de métricas
+        if self.tree_metricas is not None:
+            self._establecer_valores_metricas(["--"] * len(_METRICAS_DETALLE))
         
         # Resetear labels de métricas
         for label in self.labels_metricas.values():
-            label.config(text="--")
+            self._programar_texto_label(label, "--")
         
         # Resetear labels de calidad
         for label in self.labels_calidad.values():
-            label.config(text="--")
+            self._programar_texto_label(label, "--")
         
         # Limpiar recomendaciones
-        self.text_recomendaciones.config(state='normal')
-        self.text_recomendaciones.delete(1.0, tk.END)
-        self.text_recomendaciones.insert(1.0, "Ejecute el balanceamiento para ver recomendaciones.")
-        self.text_recomendaciones.config(state='disabled')
\ No newline at end of file
+        if self.text_recomendaciones is not None:
+            self._establecer_texto_recomendaciones("Ejecute el balanceamiento para ver recomendaciones.")
\ No newline at end of file
@@ -17,12 +17,31 @@ except ImportError:
     ImageTk = None
 import io
 import os
+from collections import OrderedDict
 from typing import Optional, List, Callable
 import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
 
 from utils.estilos import EstilosModernos, COLORES, FUENTES, ESPACIADO, UtilsUI
+from utils.rasterizador_pdf import rasterizar_pagina
 from servicios.generador_reporte_pdf import GeneradorReportePDF
 
+# Número máximo de páginas renderizadas (página, zoom) que se conservan en memoria
+_TAMANO_CACHE_PAGINAS = 8
+
+# Espera (ms) antes de rasterizar tras un cambio de zoom; agrupa los pasos rápidos de la rueda
+_DEBOUNCE_ZOOM_MS = 40
+
+# Número máximo de páginas rasterizadas al zoom base que se conservan para reescalar
+_TAMANO_CACHE_BASES = 4
+
+# Intervalo (ms) en el que se acumulan los pasos de la rueda antes de aplicarlos
+_INTERVALO_RUEDA_MS = 10
+
+# Tiempo (ms) sin pasos de rueda tras el cual un gesto de zoom se considera terminado
+_FIN_GESTO_ZOOM_MS = 200
+
 
 class PanelVistaPrevia:
     """
@@ -42,7 +61,46 @@ class PanelVistaPrevia:
         self.pagina_actual = 0
         self.total_paginas = 0
         self.zoom_actual = 1.0
-        self.archivo_temporal = None
+        self.contenido_pdf: Optional[bytes] = None
+
+        # Caché LRU de páginas renderizadas: (página, zoom en %) -> PhotoImage
+        self._cache_paginas: "OrderedDict[tuple, ImageTk.PhotoImage]" = OrderedDict()
+
+        # Rasterización fuera del hilo de Tk; el token descarta resultados obsoletos
+        self._executor_render = ThreadPoolExecutor(max_workers=1)
+
+        # Hilo reutilizable para generar el reporte; solo una generación a la vez
+        self._executor_generacion = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vista_previa_pdf")
+        self._generacion_actual: Optional[Future] = None
+        self._exportacion_en_curso = False
+        # True mientras el PDF cargado corresponda a los datos actuales
+        self._pdf_vigente = False
+        self._lock_documento = threading.Lock()
+        self._token_render = 0
+        self._render_programado = None
+
+        # Durante un gesto de zoom con la rueda se muestran borradores rápidos
+        self._gesto_zoom = False
+        self._fin_gesto_programado = None
+
+        # Pasos de rueda acumulados hasta el siguiente pase de _aplicar_rueda
+        self._rueda_scroll = 0
+        self._rueda_zoom = 0
+        self._rueda_programada = None
+
+        # Datos del documento que no cambian entre renders
+        self._rects_paginas: List = []
+
+        # Proceso de render (se crea al primer uso); recibe el PDF una vez por versión
+        self._proceso_render: Optional[ProcessPoolExecutor] = None
+        self._version_documento = 0
+        self._version_en_proceso = None
+
+        # Páginas rasterizadas al zoom base (índice -> imagen PIL), usadas para reescalar
+        self._bases_paginas: "OrderedDict[int, Image.Image]" = OrderedDict()
+
+        # Páginas vecinas precargadas en segundo plano: (página, zoom en %) -> imagen PIL
+        self._paginas_precargadas: "OrderedDict[tuple, Image.Image]" = OrderedDict()
 
         # Variables de datos para generar reporte
         self.linea_produccion = None
@@ -54,8 +112,18 @@ class PanelVistaPrevia:
         self.zoom_max = 3.0
         self.zoom_step = 0.25
 
+        # Píxeles de pantalla por punto PDF (se mide al crear el canvas); zoom 100% = tamaño real
+        self._escala_pantalla = 1.0
+        self._zoom_base = 1.0
+
         # UI elementos
         self.canvas_vista_previa = None
+        self._id_imagen_canvas = None
+        self._clave_mostrada = None  # (página, zoom en %) de la imagen en pantalla
+
+        # Últimas opciones aplicadas a botones/etiquetas y actualización idle pendiente
+        self._opciones_aplicadas = {}
+        self._actualizacion_ui_programada = None
         self.scrollbar_v = None
         self.scrollbar_h = None
         self.label_pagina = None
@@ -131,7 +199,8 @@ class PanelVistaPrevia:
                                       state='disabled')
         self.btn_anterior.pack(side='left', padx=(0, 5))
 
-        self.label_pagina = ttk.Label(frame_navegacion, text="0 / 0", style='Normal.TLabel')
+        self._var_pagina = tk.StringVar(value="0 / 0")
+        self.label_pagina = ttk.Label(frame_navegacion, textvariable=self._var_pagina, style='Normal.TLabel')
         self.label_pagina.pack(side='left', padx=5)
 
         self.btn_siguiente = ttk.Button(frame_navegacion,
@@ -153,7 +222,8 @@ class PanelVistaPrevia:
                                       state='disabled')
         self.btn_zoom_out.pack(side='left', padx=(0, 5))
 
-        self.label_zoom = ttk.Label(frame_zoom, text="100%", style='Normal.TLabel')
+        self._var_zoom = tk.StringVar(value="100%")
+        self.label_zoom = ttk.Label(frame_zoom, textvariable=self._var_zoom, style='Normal.TLabel')
         self.label_zoom.pack(side='left', padx=5)
 
         self.btn_zoom_in = ttk.Button(frame_zoom,
@@ -193,6 +263,13 @@ class PanelVistaPrevia:
                                            bg=COLORES['superficie'],
                                            highlightthickness=0)
 
+        # Renderizar a la resolución real de la pantalla (72 puntos PDF por pulgada)
+        self._escala_pantalla = self.canvas_vista_previa.winfo_fpixels('1i') / 72.0
+        # La base se rasteriza al tamaño real en pantalla (zoom 100%): los zooms menores se
+        # reescalan desde ella y los mayores se rasterizan directamente, de modo que cada
+        # página que cruza el proceso pesa lo mismo que la imagen que se muestra
+        self._zoom_base = self._escala_pantalla
+
         # Scrollbars
         self.scrollbar_v = ttk.Scrollbar(frame_contenedor, orient='vertical',
                                         command=self.canvas_vista_previa.yview)
@@ -248,6 +325,8 @@ class PanelVistaPrevia:
     def _mostrar_mensaje_inicial(self):
         """Muestra el mensaje inicial en el área de vista previa."""
         self.canvas_vista_previa.delete('all')
+        self._id_imagen_canvas = None
+        self._clave_mostrada = None
 
         # Verificar dependencias
         if not self.dependencias_disponibles:
@@ -307,6 +386,7 @@ class PanelVistaPrevia:
         self.linea_produccion = linea_produccion
         self.estaciones = estaciones
         self.metricas = metricas
+        self._pdf_vigente = False
 
         # Habilitar botón de generar si tenemos datos y dependencias
         if all([linea_produccion, estaciones, metricas]) and self.dependencias_disponibles:
@@ -333,8 +413,17 @@ class PanelVistaPrevia:
                                  "Complete el balanceamiento de línea antes de generar la vista previa.")
             return
 
-        # Ejecutar generación en hilo separado
-        threading.Thread(target=self._generar_vista_previa_async, daemon=True).start()
+        # Ignorar clics mientras una generación sigue en curso
+        if self._generacion_actual is not None and not self._generacion_actual.done():
+            return
+
+        # Los datos no cambiaron desde la última generación: reutilizar el PDF cargado
+        if self._pdf_vigente and self.pdf_documento is not None:
+            self._actualizar_estado(f"Vista previa actualizada - {self.total_paginas} páginas")
+            return
+
+        # Ejecutar generación en el hilo de trabajo del panel
+        self._generacion_actual = self._executor_generacion.submit(self._generar_vista_previa_async)
 
     def _generar_vista_previa_async(self):
         """Genera la vista previa de forma asíncrona."""
@@ -343,42 +432,47 @@ class PanelVistaPrevia:
             self.parent.after(0, lambda: self._actualizar_estado("Generando reporte PDF..."))
             self.parent.after(0, lambda: self.progress_var.set(20))
 
-            # Crear archivo temporal
-            import tempfile
-            temp_dir = tempfile.gettempdir()
-            self.archivo_temporal = os.path.join(temp_dir, "reporte_balanceo_preview.pdf")
+            # Instantánea de los datos: si cambian durante la generación el PDF ya no está vigente
+            datos = (self.linea_produccion, self.estaciones, self.metricas)
 
-            # Generar PDF
+            # Generar PDF en memoria (sin archivo temporal en disco)
             generador = GeneradorReportePDF()
             self.parent.after(0, lambda: self.progress_var.set(60))
 
-            generador.generar_reporte_completo(
-                self.linea_produccion,
-                self.estaciones,
-                self.metricas,
-                self.archivo_temporal
-            )
+            buffer = io.BytesIO()
+            generador.generar_reporte_completo(*datos, buffer)
+            contenido = buffer.getvalue()
 
             self.parent.after(0, lambda: self.progress_var.set(80))
 
             # Cargar PDF en el visor
-            self.parent.after(0, lambda: self._cargar_pdf(self.archivo_temporal))
+            self.parent.after(0, lambda: self._cargar_pdf(contenido, datos))
 
         except Exception as e:
             error_msg = str(e)
             self.parent.after(0, lambda: self._manejar_error("Error al generar vista previa", error_msg))
 
-    def _cargar_pdf(self, ruta_archivo: str):
-        """Carga un archivo PDF en el visor."""
+    def _cargar_pdf(self, contenido: bytes, datos: Optional[tuple] = None):
+        """Carga en el visor un PDF generado en memoria a partir de `datos`."""
         try:
-            # Cerrar documento anterior si existe
-            if self.pdf_documento:
-                self.pdf_documento.close()
+            # La reutilización del PDF con datos sin cambios se decide antes de generarlo
+            # (_pdf_vigente): cada generación trae fecha e /ID propios y siempre se abre
+            with self._lock_documento:
+                # Cerrar documento anterior si existe
+                self._cerrar_documento()
+                self._cache_paginas.clear()
+
+                # Abrir nuevo documento
+                self.pdf_documento = fitz.open(stream=contenido, filetype="pdf")
+                self._rects_paginas = [pagina.rect for pagina in self.pdf_documento]
+                self.contenido_pdf = contenido
+                self._version_documento += 1
 
-            # Abrir nuevo documento
-            self.pdf_documento = fitz.open(ruta_archivo)
             self.total_paginas = len(self.pdf_documento)
             self.pagina_actual = 0
+            self._pdf_vigente = datos is not None and all(
+                generado is actual for generado, actual
+                in zip(datos, (self.linea_produccion, self.estaciones, self.metricas)))
 
             # Actualizar controles
             self._actualizar_controles()
@@ -396,66 +490,269 @@ class PanelVistaPrevia:
         except Exception as e:
             self._manejar_error("Error al cargar PDF", str(e))
 
+    def _cerrar_documento(self):
+        """
+        Cierra el documento actual y libera sus buffers de imagen.
+        Debe llamarse con _lock_documento tomado.
+        """
+        self._bases_paginas.clear()
+        self._paginas_precargadas.clear()
+        self._clave_mostrada = None
+        if self.pdf_documento:
+            self.pdf_documento.close()
+            self.pdf_documento = None
+
+    def _detener_proceso_render(self):
+        """Termina el proceso de render; se vuelve a crear al siguiente render."""
+        if self._proceso_render is not None:
+            self._proceso_render.shutdown(wait=False)
+            self._proceso_render = None
+            self._version_en_proceso = None
+
     def _mostrar_pagina_actual(self):
-        """Muestra la página actual del PDF."""
+        """
+        Muestra la página actual del PDF.
+        La rasterización se hace en un hilo de trabajo; en el hilo de Tk solo se
+        construye el PhotoImage y se actualiza el canvas.
+        """
         if not self.pdf_documento or self.pagina_actual >= self.total_paginas:
             return
 
-        try:
-            # Obtener página
-            pagina = self.pdf_documento[self.pagina_actual]
+        # Cualquier render pendiente anterior queda obsoleto
+        self._token_render += 1
+
+        clave = (self.pagina_actual, round(self.zoom_actual * 100))
+        zoom_render = self.zoom_actual * self._escala_pantalla
+        if clave == self._clave_mostrada:
+            # La página y el zoom en pantalla ya son los pedidos
+            return
+
+        img_tk = self._cache_paginas.get(clave)
 
-            # Crear matriz de transformación para zoom
-            matriz = fitz.Matrix(self.zoom_actual, self.zoom_actual)
+        if img_tk is not None:
+            # Página ya renderizada con este zoom: solo marcarla como reciente
+            self._cache_paginas.move_to_end(clave)
+            self._mostrar_imagen(img_tk, clave)
+        else:
+            img_pil = self._paginas_precargadas.pop(clave, None)
+            if img_pil is not None:
+                # Página vecina ya rasterizada en segundo plano: solo falta el PhotoImage
+                self._aplicar_render(self._token_render, clave, img_pil)
+            elif self._gesto_zoom:
+                # Borrador con remuestreo rápido; no se cachea y se rehace al terminar el gesto
+                self._executor_render.submit(self._renderizar_pagina, self.pdf_documento,
+                                             self.pagina_actual, zoom_render, None,
+                                             self._token_render, Image.NEAREST)
+            else:
+                self._executor_render.submit(self._renderizar_pagina, self.pdf_documento,
+                                             self.pagina_actual, zoom_render, clave, self._token_render)
 
-            # Renderizar página como imagen
-            pix = pagina.get_pixmap(matrix=matriz)
-            img_data = pix.tobytes("ppm")
+        if self._gesto_zoom:
+            return
 
-            # Convertir a imagen PIL
-            img_pil = Image.open(io.BytesIO(img_data))
+        # Precargar las páginas vecinas detrás del render actual
+        for vecina in (self.pagina_actual + 1, self.pagina_actual - 1):
+            if 0 <= vecina < self.total_paginas:
+                self._executor_render.submit(self._precargar_pagina, self.pdf_documento, vecina,
+                                             zoom_render, (vecina, clave[1]), self._token_render)
+
+    def _programar_render(self):
+        """Programa el render de la página actual; solo se ejecuta el último de una ráfaga."""
+        if self._render_programado is not None:
+            self.parent.after_cancel(self._render_programado)
+        self._render_programado = self.parent.after(_DEBOUNCE_ZOOM_MS, self._ejecutar_render_programado)
+
+    def _ejecutar_render_programado(self):
+        """Ejecuta el render pendiente programado por _programar_render."""
+        self._render_programado = None
+        self._mostrar_pagina_actual()
+
+    def _renderizar_pagina(self, documento, indice: int, zoom: float, clave: Optional[tuple], token: int,
+                           remuestreo=None):
+        """
+        Rasteriza una página en el hilo de trabajo y entrega la imagen PIL al hilo de Tk.
+        Con clave None el resultado es un borrador y no se guarda en la caché.
+        """
+        try:
+            img_pil = self._rasterizar(documento, indice, zoom, token, remuestreo)
+            if img_pil is not None:
+                self.parent.after(0, self._aplicar_render, token, clave, img_pil)
 
-            # Convertir a ImageTk para mostrar en tkinter
-            self.img_tk = ImageTk.PhotoImage(img_pil)
+        except Exception as e:
+            # Un fallo de un render ya obsoleto (p. ej. vista previa limpiada) no se reporta
+            if token != self._token_render:
+                return
+            error_msg = str(e)
+            self.parent.after(0, lambda: self._manejar_error("Error al mostrar página", error_msg))
+
+    def _precargar_pagina(self, documento, indice: int, zoom: float, clave: tuple, token: int):
+        """
+        Rasteriza en segundo plano una página vecina para que la navegación sea inmediata.
+        Se descarta si el usuario ya pidió otra página o zoom.
+        """
+        if clave in self._cache_paginas or clave in self._paginas_precargadas:
+            return
 
-            # Limpiar canvas y mostrar imagen
-            self.canvas_vista_previa.delete('all')
-            self.canvas_vista_previa.create_image(0, 0, anchor='nw', image=self.img_tk)
+        try:
+            img_pil = self._rasterizar(documento, indice, zoom, token)
+        except Exception:
+            # La precarga es solo una optimización; un fallo se repetirá y reportará al navegar
+            return
 
-            # Configurar región de scroll
-            self.canvas_vista_previa.configure(scrollregion=self.canvas_vista_previa.bbox('all'))
+        with self._lock_documento:
+            if img_pil is None or documento is not self.pdf_documento:
+                return
+            self._paginas_precargadas[clave] = img_pil
+            if len(self._paginas_precargadas) > _TAMANO_CACHE_PAGINAS:
+                self._paginas_precargadas.popitem(last=False)
+
+    def _rasterizar(self, documento, indice: int, zoom: float, token: Optional[int] = None,
+                    remuestreo=None):
+        """
+        Rasteriza una página al zoom indicado. Devuelve None si el documento o el token
+        quedaron obsoletos mientras la tarea esperaba.
+        Hasta el zoom base la página se rasteriza una sola vez y los demás niveles
+        de zoom se obtienen reescalando esa imagen, sin volver a llamar a MuPDF.
+        Los borradores (con `remuestreo`) también se reescalan desde la base por
+        encima del zoom base, de modo que un gesto de zoom nunca espera a MuPDF.
+        """
+        with self._lock_documento:
+            # El documento pudo cerrarse o reemplazarse mientras esperaba
+            if documento is not self.pdf_documento:
+                return None
+            if token is not None and token != self._token_render:
+                return None
+
+            base = self._bases_paginas.get(indice)
+            if base is not None:
+                self._bases_paginas.move_to_end(indice)
+            origen = (self._version_documento, self.contenido_pdf)
+
+        if zoom > self._zoom_base and remuestreo is None:
+            # Por encima del zoom base se rasteriza directamente, salvo los borradores
+            return self._rasterizar_en_proceso(origen, indice, zoom)
+
+        if base is None:
+            base = self._rasterizar_en_proceso(origen, indice, self._zoom_base)
+            with self._lock_documento:
+                if documento is self.pdf_documento:
+                    self._bases_paginas[indice] = base
+                    if len(self._bases_paginas) > _TAMANO_CACHE_BASES:
+                        self._bases_paginas.popitem(last=False)
+
+        if zoom == self._zoom_base:
+            return base
+
+        escala = zoom / self._zoom_base
+        tamano = (max(1, round(base.width * escala)), max(1, round(base.height * escala)))
+        return base.resize(tamano, Image.BILINEAR if remuestreo is None else remuestreo)
+
+    def _rasterizar_en_proceso(self, origen: tuple, indice: int, zoom: float):
+        """
+        Rasteriza una página en el proceso de render y construye la imagen PIL con sus muestras.
+        Se llama desde el hilo de trabajo, que solo espera el resultado.
+        """
+        if self._proceso_render is None:
+            self._proceso_render = ProcessPoolExecutor(max_workers=1,
+                                                       mp_context=multiprocessing.get_context("spawn"))
+
+        # El contenido del PDF solo se envía al proceso la primera vez para cada versión
+        version, contenido = origen
+        if self._version_en_proceso == version:
+            contenido = None
+        ancho, alto, muestras = self._proceso_render.submit(
+            rasterizar_pagina, version, contenido, indice, zoom).result()
+        self._version_en_proceso = version
+        return Image.frombytes("RGB", (ancho, alto), muestras)
+
+    def _aplicar_render(self, token: int, clave: Optional[tuple], img_pil):
+        """Recibe en el hilo de Tk una página rasterizada y la muestra si sigue vigente."""
+        if token != self._token_render:
+            return
+
+        try:
+            # Convertir a ImageTk para mostrar en tkinter (debe hacerse en el hilo de Tk)
+            img_tk = ImageTk.PhotoImage(img_pil)
 
-            # Actualizar información de página
-            self._actualizar_info_pagina()
+            if clave is not None:
+                self._cache_paginas[clave] = img_tk
+                if len(self._cache_paginas) > _TAMANO_CACHE_PAGINAS:
+                    self._cache_paginas.popitem(last=False)
+
+            self._mostrar_imagen(img_tk, clave)
 
         except Exception as e:
             self._manejar_error("Error al mostrar página", str(e))
 
+    def _mostrar_imagen(self, img_tk, clave: Optional[tuple]):
+        """Coloca una página ya renderizada en el canvas (clave None para un borrador)."""
+        self.img_tk = img_tk
+        self._clave_mostrada = clave
+
+        if self._id_imagen_canvas is None:
+            # Primera página tras el mensaje inicial: crear el item de imagen una sola vez
+            self.canvas_vista_previa.delete('all')
+            self._id_imagen_canvas = self.canvas_vista_previa.create_image(0, 0, anchor='nw', image=self.img_tk)
+        else:
+            # Cambiar la imagen del item existente evita repintar un canvas vacío entre páginas
+            self.canvas_vista_previa.itemconfigure(self._id_imagen_canvas, image=self.img_tk)
+
+        # Configurar región de scroll
+        self.canvas_vista_previa.configure(scrollregion=(0, 0, self.img_tk.width(), self.img_tk.height()))
+
+        # Actualizar información de página
+        self._actualizar_info_pagina()
+
     def _actualizar_controles(self):
-        """Actualiza el estado de los controles."""
+        """Actualiza el estado de los controles (agrupado en un único pase en idle)."""
+        self._programar_actualizacion_ui()
+
+    def _actualizar_info_pagina(self):
+        """Actualiza la información de página y zoom (agrupado en un único pase en idle)."""
+        self._programar_actualizacion_ui()
+
+    def _programar_actualizacion_ui(self):
+        """Agrupa las actualizaciones de controles y etiquetas en un solo callback idle."""
+        if self._actualizacion_ui_programada is None:
+            self._actualizacion_ui_programada = self.parent.after_idle(self._aplicar_actualizacion_ui)
+
+    def _aplicar_actualizacion_ui(self):
+        """Aplica el estado de botones y etiquetas, configurando solo lo que cambió."""
+        self._actualizacion_ui_programada = None
         tiene_pdf = self.pdf_documento is not None
 
         # Controles de navegación
         estado_nav = 'normal' if tiene_pdf else 'disabled'
-        self.btn_anterior.configure(state='normal' if tiene_pdf and self.pagina_actual > 0 else 'disabled')
-        self.btn_siguiente.configure(state='normal' if tiene_pdf and self.pagina_actual < self.total_paginas - 1 else 'disabled')
+        self._configurar_si_cambia(self.btn_anterior, 'state', 'normal' if tiene_pdf and self.pagina_actual > 0 else 'disabled')
+        self._configurar_si_cambia(self.btn_siguiente, 'state', 'normal' if tiene_pdf and self.pagina_actual < self.total_paginas - 1 else 'disabled')
 
         # Controles de zoom
-        self.btn_zoom_in.configure(state='normal' if tiene_pdf and self.zoom_actual < self.zoom_max else 'disabled')
-        self.btn_zoom_out.configure(state='normal' if tiene_pdf and self.zoom_actual > self.zoom_min else 'disabled')
-        self.btn_zoom_fit.configure(state=estado_nav)
-
-        # Control de exportación
-        self.btn_exportar_pdf.configure(state=estado_nav)
-
-    def _actualizar_info_pagina(self):
-        """Actualiza la información de página y zoom."""
-        if self.pdf_documento:
-            self.label_pagina.configure(text=f"{self.pagina_actual + 1} / {self.total_paginas}")
-        else:
-            self.label_pagina.configure(text="0 / 0")
-
-        self.label_zoom.configure(text=f"{int(self.zoom_actual * 100)}%")
+        self._configurar_si_cambia(self.btn_zoom_in, 'state', 'normal' if tiene_pdf and self.zoom_actual < self.zoom_max else 'disabled')
+        self._configurar_si_cambia(self.btn_zoom_out, 'state', 'normal' if tiene_pdf and self.zoom_actual > self.zoom_min else 'disabled')
+        self._configurar_si_cambia(self.btn_zoom_fit, 'state', estado_nav)
+
+        # Control de exportación (deshabilitado mientras se escribe un archivo)
+        self._configurar_si_cambia(self.btn_exportar_pdf, 'state',
+                                   'normal' if tiene_pdf and not self._exportacion_en_curso else 'disabled')
+
+        # Información de página y zoom
+        texto_pagina = f"{self.pagina_actual + 1} / {self.total_paginas}" if tiene_pdf else "0 / 0"
+        self._asignar_si_cambia(self._var_pagina, texto_pagina)
+        self._asignar_si_cambia(self._var_zoom, f"{int(self.zoom_actual * 100)}%")
+
+    def _configurar_si_cambia(self, widget, opcion: str, valor: str):
+        """Configura una opción del widget solo si difiere del último valor aplicado."""
+        clave = (str(widget), opcion)
+        if self._opciones_aplicadas.get(clave) != valor:
+            self._opciones_aplicadas[clave] = valor
+            widget.configure(**{opcion: valor})
+
+    def _asignar_si_cambia(self, variable: tk.StringVar, valor: str):
+        """Asigna el texto a la variable de Tk solo si difiere del último valor asignado."""
+        clave = (str(variable), 'valor')
+        if self._opciones_aplicadas.get(clave) != valor:
+            self._opciones_aplicadas[clave] = valor
+            variable.set(valor)
 
     def _pagina_anterior(self):
         """Navega a la página anterior."""
@@ -473,16 +770,18 @@ class PanelVistaPrevia:
 
     def _zoom_in(self):
         """Aumenta el zoom."""
-        if self.zoom_actual < self.zoom_max:
-            self.zoom_actual = min(self.zoom_actual + self.zoom_step, self.zoom_max)
-            self._mostrar_pagina_actual()
-            self._actualizar_controles()
+        self._cambiar_zoom(1)
 
     def _zoom_out(self):
         """Disminuye el zoom."""
-        if self.zoom_actual > self.zoom_min:
-            self.zoom_actual = max(self.zoom_actual - self.zoom_step, self.zoom_min)
-            self._mostrar_pagina_actual()
+        self._cambiar_zoom(-1)
+
+    def _cambiar_zoom(self, pasos: int):
+        """Cambia el zoom en el número de pasos indicado (negativo para alejar), dentro de los límites."""
+        zoom = min(max(self.zoom_actual + pasos * self.zoom_step, self.zoom_min), self.zoom_max)
+        if zoom != self.zoom_actual:
+            self.zoom_actual = zoom
+            self._programar_render()
             self._actualizar_controles()
 
     def _zoom_fit(self):
@@ -491,24 +790,23 @@ class PanelVistaPrevia:
             return
 
         try:
-            # Obtener dimensiones de la página
-            pagina = self.pdf_documento[self.pagina_actual]
-            rect_pagina = pagina.rect
+            # Obtener dimensiones de la página (cacheadas al cargar el documento)
+            rect_pagina = self._rects_paginas[self.pagina_actual]
 
             # Obtener dimensiones del canvas
             canvas_width = self.canvas_vista_previa.winfo_width()
             canvas_height = self.canvas_vista_previa.winfo_height()
 
             if canvas_width > 1 and canvas_height > 1:
-                # Calcular zoom para ajustar
-                zoom_x = (canvas_width - 50) / rect_pagina.width
-                zoom_y = (canvas_height - 50) / rect_pagina.height
+                # Calcular zoom para ajustar (el render aplica además la escala de pantalla)
+                zoom_x = (canvas_width - 50) / (rect_pagina.width * self._escala_pantalla)
+                zoom_y = (canvas_height - 50) / (rect_pagina.height * self._escala_pantalla)
 
                 # Usar el menor zoom para que quepa completo
                 self.zoom_actual = min(zoom_x, zoom_y, self.zoom_max)
                 self.zoom_actual = max(self.zoom_actual, self.zoom_min)
 
-                self._mostrar_pagina_actual()
+                self._programar_render()
                 self._actualizar_controles()
 
         except Exception as e:
@@ -516,10 +814,13 @@ class PanelVistaPrevia:
 
     def _exportar_pdf(self):
         """Exporta el PDF a un archivo seleccionado por el usuario."""
-        if not self.archivo_temporal or not os.path.exists(self.archivo_temporal):
+        if not self.contenido_pdf:
             messagebox.showerror("Exportar PDF", "No hay vista previa generada para exportar.")
             return
 
+        if self._exportacion_en_curso:
+            return
+
         try:
             # Solicitar ubicación de guardado
             archivo_destino = filedialog.asksaveasfilename(
@@ -533,17 +834,38 @@ class PanelVistaPrevia:
             )
 
             if archivo_destino:
-                # Copiar archivo temporal al destino
-                import shutil
-                shutil.copy2(self.archivo_temporal, archivo_destino)
-
-                self._actualizar_estado(f"PDF exportado exitosamente: {os.path.basename(archivo_destino)}")
-                messagebox.showinfo("Exportar PDF",
-                                  f"Reporte exportado exitosamente a:\n{archivo_destino}")
+                # Escribir en el hilo de trabajo una instantánea del PDF en memoria
+                self._exportacion_en_curso = True
+                self._actualizar_controles()
+                self._actualizar_estado("Exportando PDF...")
+                self._executor_generacion.submit(self._escribir_pdf, archivo_destino, self.contenido_pdf)
 
         except Exception as e:
             self._manejar_error("Error al exportar PDF", str(e))
 
+    def _escribir_pdf(self, archivo_destino: str, contenido: bytes):
+        """Escribe el PDF en disco fuera del hilo de Tk y notifica el resultado."""
+        try:
+            with open(archivo_destino, 'wb') as archivo:
+                archivo.write(contenido)
+            error = None
+        except Exception as e:
+            error = str(e)
+        self.parent.after(0, self._finalizar_exportacion, archivo_destino, error)
+
+    def _finalizar_exportacion(self, archivo_destino: str, error: Optional[str]):
+        """Rehabilita la exportación e informa el resultado al usuario."""
+        self._exportacion_en_curso = False
+        self._actualizar_controles()
+
+        if error is not None:
+            self._manejar_error("Error al exportar PDF", error)
+            return
+
+        self._actualizar_estado(f"PDF exportado exitosamente: {os.path.basename(archivo_destino)}")
+        messagebox.showinfo("Exportar PDF",
+                          f"Reporte exportado exitosamente a:\n{archivo_destino}")
+
     def _obtener_timestamp(self):
         """Obtiene un timestamp para nombres de archivo."""
         from datetime import datetime
@@ -554,17 +876,41 @@ class PanelVistaPrevia:
         if not self.pdf_documento:
             return
 
-        # Determinar dirección del scroll
-        if event.delta > 0 or event.num == 4:  # Scroll hacia arriba
-            if event.state & 0x4:  # Ctrl presionado
-                self._zoom_in()
-            else:
-                self.canvas_vista_previa.yview_scroll(-1, "units")
-        else:  # Scroll hacia abajo
-            if event.state & 0x4:  # Ctrl presionado
-                self._zoom_out()
-            else:
-                self.canvas_vista_previa.yview_scroll(1, "units")
+        # Acumular los pasos (+1 hacia arriba, -1 hacia abajo) y aplicarlos juntos
+        paso = 1 if event.delta > 0 or event.num == 4 else -1
+        if event.state & 0x4:  # Ctrl presionado: gesto de zoom
+            self._marcar_gesto_zoom()
+            self._rueda_zoom += paso
+        else:
+            self._rueda_scroll += paso
+
+        if self._rueda_programada is None:
+            self._rueda_programada = self.parent.after(_INTERVALO_RUEDA_MS, self._aplicar_rueda)
+
+    def _aplicar_rueda(self):
+        """Aplica en una sola operación los pasos de rueda acumulados."""
+        self._rueda_programada = None
+        scroll, zoom = self._rueda_scroll, self._rueda_zoom
+        self._rueda_scroll = self._rueda_zoom = 0
+
+        if scroll:
+            self.canvas_vista_previa.yview_scroll(-scroll, "units")
+        if zoom:
+            self._cambiar_zoom(zoom)
+
+    def _marcar_gesto_zoom(self):
+        """Activa el modo borrador mientras lleguen pasos de zoom con la rueda."""
+        self._gesto_zoom = True
+        if self._fin_gesto_programado is not None:
+            self.parent.after_cancel(self._fin_gesto_programado)
+        self._fin_gesto_programado = self.parent.after(_FIN_GESTO_ZOOM_MS, self._fin_gesto_zoom)
+
+    def _fin_gesto_zoom(self):
+        """Termina el gesto de zoom y vuelve a renderizar la página con calidad completa."""
+        self._fin_gesto_programado = None
+        self._gesto_zoom = False
+        if self._render_programado is None:
+            self._mostrar_pagina_actual()
 
     def _on_key_press(self, event):
         """Maneja eventos de teclado."""
@@ -611,23 +957,26 @@ class PanelVistaPrevia:
     def limpiar_vista_previa(self):
         """Limpia la vista previa actual."""
         try:
-            # Cerrar documento PDF
-            if self.pdf_documento:
-                self.pdf_documento.close()
-                self.pdf_documento = None
+            # Cerrar documento PDF y descartar renders pendientes
+            if self._render_programado is not None:
+                self.parent.after_cancel(self._render_programado)
+                self._render_programado = None
+            self._token_render += 1
+            with self._lock_documento:
+                self._cerrar_documento()
+            self._cache_paginas.clear()
+            self._rects_paginas = []
+            self.img_tk = None
+            self._detener_proceso_render()
 
             # Limpiar variables
             self.pagina_actual = 0
             self.total_paginas = 0
             self.zoom_actual = 1.0
 
-            # Eliminar archivo temporal
-            if self.archivo_temporal and os.path.exists(self.archivo_temporal):
-                try:
-                    os.remove(self.archivo_temporal)
-                except:
-                    pass
-                self.archivo_temporal = None
+            # Liberar el PDF en memoria
+            self.contenido_pdf = None
+            self._pdf_vigente = False
 
             # Limpiar datos
             self.linea_produccion = None
@@ -646,10 +995,13 @@ class PanelVistaPrevia:
     def __del__(self):
         """Destructor para limpiar recursos."""
         try:
+            if hasattr(self, '_executor_render'):
+                self._executor_render.shutdown(wait=False)
+            if hasattr(self, '_executor_generacion'):
+                self._executor_generacion.shutdown(wait=False)
+            if hasattr(self, '_proceso_render'):
+                self._detener_proceso_render()
             if hasattr(self, 'pdf_documento') and self.pdf_documento:
                 self.pdf_documento.close()
-            if hasattr(self, 'archivo_temporal') and self.archivo_temporal:
-                if os.path.exists(self.archivo_temporal):
-                    os.remove(self.archivo_temporal)
         except:
             pass
\ No newline at end of file
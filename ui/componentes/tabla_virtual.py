@@ -0,0 +1,170 @@
+"""
+Tabla con desplazamiento virtual basada en ttk.Treeview
+Usada por las tablas de estaciones y de eficiencia para mostrar solo las filas visibles
+"""
+
+from tkinter import TclError, ttk
+from typing import List, Sequence, Tuple
+
+
+# Por debajo de este número de filas la tabla se llena de forma convencional
+_UMBRAL_VIRTUAL = 50
+
+# Altura de fila (px) si el estilo no la define
+_ALTO_FILA = 20
+
+
+class TablaVirtual:
+    """
+    Treeview con desplazamiento virtual para conjuntos grandes de filas.
+
+    Con pocas filas se comporta como un Treeview normal. Con más de
+    `umbral_virtual` filas solo mantiene en el widget las filas visibles y
+    las reutiliza al desplazarse, de modo que el trabajo de Tcl por
+    actualización no depende del tamaño del conjunto. En ambos casos los
+    items se conservan entre actualizaciones y solo se tocan los que cambian.
+    """
+
+    def __init__(self, parent, columnas: Sequence[Tuple[str, str, int]], altura: int = 8,
+                 umbral_virtual: int = _UMBRAL_VIRTUAL):
+        self.umbral_virtual = umbral_virtual
+        self._filas: List[tuple] = []
+        self._items: List[str] = []
+        self._valores: List[tuple] = []  # Valores mostrados actualmente en cada item
+        self._inicio = 0
+        self._virtual = False
+
+        ids_columnas = tuple(columna for columna, _, _ in columnas)
+        self.tree = ttk.Treeview(parent, columns=ids_columnas, show='headings', height=altura)
+
+        # Configurar encabezados y anchos de columnas
+        for columna, encabezado, ancho in columnas:
+            self.tree.heading(columna, text=encabezado)
+            self.tree.column(columna, width=ancho)
+
+        # La barra se controla aquí para poder desplazar la ventana virtual
+        self.scrollbar = ttk.Scrollbar(parent, orient='vertical', command=self._on_scrollbar)
+        self.tree.configure(yscrollcommand=self._on_yscroll_tree)
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_rueda)
+        self.tree.bind('<Button-4>', self._on_rueda)
+        self.tree.bind('<Button-5>', self._on_rueda)
+
+    def pack(self):
+        """Empaqueta la tabla y su barra de desplazamiento."""
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+
+    def establecer_filas(self, filas: Sequence[tuple]):
+        """Reemplaza el contenido completo de la tabla."""
+        self._filas = list(filas)
+        self._inicio = 0
+        self.tree.yview_moveto(0)
+
+        self._virtual = len(self._filas) > self.umbral_virtual
+        if self._virtual:
+            self._refrescar_ventana()
+        else:
+            self._mostrar(self._filas)
+
+    def limpiar(self):
+        """Elimina todas las filas."""
+        if self._filas or self._items:
+            self.establecer_filas(())
+
+    def _filas_visibles(self) -> int:
+        """Número de filas que caben en el área visible del widget."""
+        alto = self.tree.winfo_height()
+        if alto <= 1:
+            # Aún no mapeado: usar la altura configurada en filas
+            return int(self.tree.cget('height'))
+        if self._items:
+            caja = self.tree.bbox(self._items[0])
+            if caja:
+                _, y, _, alto_fila = caja
+                if alto_fila > 0:
+                    return max(1, (alto - y) // alto_fila)
+        # Sin filas que medir: estimar con la altura de fila del estilo (encabezado incluido)
+        try:
+            alto_fila = int(ttk.Style().lookup('Treeview', 'rowheight') or _ALTO_FILA)
+        except (ValueError, TclError):
+            alto_fila = _ALTO_FILA
+        return max(1, (alto - alto_fila) // alto_fila)
+
+    def _refrescar_ventana(self):
+        """Muestra en los items reutilizados las filas [inicio, inicio + visibles)."""
+        total = len(self._filas)
+        visibles = min(self._filas_visibles(), total)
+        self._inicio = max(0, min(self._inicio, total - visibles))
+        self._mostrar(self._filas[self._inicio:self._inicio + visibles])
+
+        if total:
+            self.scrollbar.set(self._inicio / total, (self._inicio + visibles) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _mostrar(self, filas: Sequence[tuple]):
+        """
+        Muestra las filas indicadas en los items reutilizables.
+        Solo se actualizan los items cuyo contenido cambió, se crean los que
+        faltan y se eliminan en un solo paso los que sobran.
+        """
+        cantidad = len(filas)
+        if len(self._items) > cantidad:
+            self.tree.delete(*self._items[cantidad:])
+            del self._items[cantidad:]
+            del self._valores[cantidad:]
+
+        item = self.tree.item
+        for posicion, fila in enumerate(filas):
+            if posicion < len(self._items):
+                if self._valores[posicion] != fila:
+                    item(self._items[posicion], values=fila)
+                    self._valores[posicion] = fila
+            else:
+                self._items.append(self.tree.insert('', 'end', values=fila))
+                self._valores.append(fila)
+
+    def _desplazar_a(self, inicio: int):
+        """Mueve la ventana virtual a la fila indicada."""
+        if inicio != self._inicio:
+            self._inicio = inicio
+            self._refrescar_ventana()
+
+    def _on_scrollbar(self, *args):
+        """Atiende los comandos de la barra de desplazamiento."""
+        if not self._virtual:
+            self.tree.yview(*args)
+            return
+
+        visibles = len(self._items) or 1
+        if args[0] == 'moveto':
+            self._desplazar_a(int(float(args[1]) * len(self._filas)))
+        elif args[0] == 'scroll':
+            paso = visibles if args[2] == 'pages' else 1
+            self._desplazar_a(self._inicio + int(args[1]) * paso)
+
+    def _on_yscroll_tree(self, primero, ultimo):
+        """Refleja el desplazamiento nativo del Treeview cuando no es virtual."""
+        if not self._virtual:
+            self.scrollbar.set(primero, ultimo)
+
+    def _on_configure(self, event=None):
+        """Recalcula las filas visibles al cambiar el tamaño del widget."""
+        if self._virtual:
+            self._refrescar_ventana()
+
+    def _on_rueda(self, event):
+        """Desplaza la ventana virtual con la rueda del ratón."""
+        if not self._virtual:
+            return None
+
+        if event.num == 4:
+            pasos = -1
+        elif event.num == 5:
+            pasos = 1
+        else:
+            pasos = -1 if event.delta > 0 else 1
+        self._desplazar_a(self._inicio + pasos * 3)
+        return 'break'
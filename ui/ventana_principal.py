@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
-from typing import Dict, List
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 # Importar modelos
 from modelos.tarea import Tarea
@@ -16,10 +18,114 @@ from ui.componentes.panel_entrada import PanelEntradaDatos
 from ui.componentes.panel_resultados import PanelResultados
 from ui.componentes.panel_graficos import PanelGraficos
 from ui.componentes.panel_vista_previa_pdf import PanelVistaPrevia
+from ui.componentes.tabla_virtual import TablaVirtual
 
 # Importar utilidades
 from utils.estilos import EstilosModernos, COLORES, FUENTES, ESPACIADO, UtilsUI
 from utils.validacion import ValidacionError
+from utils.graf_kernels import calcular_utilizaciones
+
+
+# Columnas de la tabla de eficiencia: (id, encabezado, ancho)
+_COLUMNAS_EFICIENCIA = (
+    ('Estación', 'Estación', 80),
+    ('Tareas', 'Tareas Asignadas', 150),
+    ('Tiempo Total', 'Tiempo Total (min)', 120),
+    ('Utilización %', 'Utilización %', 100),
+    ('Tiempo Ocioso', 'Tiempo Ocioso (min)', 120),
+    ('Estado', 'Estado', 100),
+)
+
+# Estado de cada estación según su utilización (%): el índice es el número de umbrales superados
+_UMBRALES_ESTADO_ESTACION = (50, 75, 90)
+_ESTADOS_ESTACION = ("🔵 Baja", "🟢 Óptima", "🟡 Alta", "🔴 Sobrecargada")
+
+# Indicadores clave mostrados en la grilla 2x3: (clave, nombre, unidad)
+_ESPECIFICACION_KPIS = (
+    ('eficiencia_linea', 'Eficiencia de Línea', '%'),
+    ('balance_suavidad', 'Balance de Suavidad', ''),
+    ('tiempo_ocioso_total', 'Tiempo Ocioso Total', 'min'),
+    ('estaciones_optimas', 'Desviación vs Óptimo', 'estaciones'),
+    ('capacidad_produccion', 'Capacidad de Producción', 'und/día'),
+    ('indice_productividad', 'Índice de Productividad', ''),
+)
+
+# Valor mostrado por los KPIs sin resultados
+_KPI_DEFAULT = "--"
+
+# Intervalo mínimo entre vaciados forzados de la cola idle al actualizar el estado (s)
+_INTERVALO_VACIADO_ESTADO = 0.05
+
+# Texto del análisis temporal cuando no hay resultados
+_PLACEHOLDER_TEMPORAL = "No hay datos de análisis disponibles.\n\nEjecute el balanceamiento para ver el análisis."
+
+
+# Texto de la ventana de ayuda
+_TEXTO_AYUDA = """
+CALCULADORA DE BALANCEAMIENTO DE LÍNEAS - ALGORITMO RPW
+
+¿Qué es el algoritmo RPW?
+El algoritmo Ranked Positional Weight (RPW) es un método heurístico para
+balancear líneas de producción. Asigna tareas a estaciones de trabajo
+minimizando el número de estaciones necesarias.
+
+Cómo usar la aplicación:
+1. Configure la demanda diaria y tiempo disponible
+2. Agregue tareas con sus tiempos y precedencias
+3. Ejecute el balanceamiento (Ctrl+R)
+4. Analice los resultados y gráficos
+5. Exporte los resultados si es necesario
+
+Atajos de teclado:
+- Ctrl+R: Ejecutar balanceamiento
+- Ctrl+L: Limpiar resultados
+- Ctrl+S: Exportar resultados
+- F1: Mostrar esta ayuda
+- Esc: Cerrar aplicación
+
+Métricas importantes:
+- Eficiencia de línea: % de utilización promedio de las estaciones
+- Tiempo de ciclo: Tiempo máximo disponible por estación
+- Balance de suavidad: Medida de equilibrio entre estaciones
+            """
+
+# Mensaje mostrado al completar el balanceamiento
+_PLANTILLA_RESUMEN = """
+✅ BALANCEAMIENTO COMPLETADO
+
+📊 Resultados:
+• Número de estaciones: {num_estaciones}
+• Eficiencia de línea: {eficiencia:.1f}%
+• Tiempo de ciclo: {tiempo_ciclo:.2f} min
+
+💡 Los resultados se muestran en los paneles de la derecha.
+Puede exportar el reporte completo usando Ctrl+S.
+            """
+
+
+def _validar_tiene_tareas(datos_tareas: List[Dict], config: Dict) -> Tuple[bool, Optional[str]]:
+    """Comprueba que exista al menos una tarea."""
+    if not datos_tareas:
+        return False, "Debe definir al menos una tarea"
+    return True, None
+
+
+def _validar_demanda_positiva(datos_tareas: List[Dict], config: Dict) -> Tuple[bool, Optional[str]]:
+    """Comprueba que la demanda diaria sea positiva."""
+    if config.get('demanda_diaria', 0) <= 0:
+        return False, "La demanda diaria debe ser mayor a 0"
+    return True, None
+
+
+def _validar_tiempo_positivo(datos_tareas: List[Dict], config: Dict) -> Tuple[bool, Optional[str]]:
+    """Comprueba que el tiempo disponible sea positivo."""
+    if config.get('tiempo_disponible', 0) <= 0:
+        return False, "El tiempo disponible debe ser mayor a 0"
+    return True, None
+
+
+# Validaciones de la entrada antes de balancear, en el orden en que se informan
+_VALIDADORES_ENTRADA = (_validar_tiene_tareas, _validar_demanda_positiva, _validar_tiempo_positivo)
 
 
 class VentanaPrincipal:
@@ -29,6 +135,14 @@ class VentanaPrincipal:
     """
     
     def __init__(self):
+        # Atributos usados por el manejo de errores; existen antes de que algo pueda fallar
+        self.root = None
+        self.label_estado = None
+        self.progress_bar = None
+        self._ultimo_progreso = 0.0
+        self._ultimo_estado = None
+        self._ultimo_vaciado_estado = 0.0
+
         try:
             self.root = tk.Tk()
             self.linea_produccion = None
@@ -40,16 +154,24 @@ class VentanaPrincipal:
             self.panel_resultados = None
             self.panel_graficos = None
             self.panel_vista_previa = None
+            self.notebook_principal = None
+            # Pestañas cuyo contenido se construye al mostrarlas por primera vez
+            self._constructores_pestanas: Dict[str, Callable[[], None]] = {}
 
             # Variables de estado - inicializar
             self.datos_balanceados = False
-            self.progreso_var = None
-            self.label_estado = None
+            # Se editaron datos de entrada en esta sesión (se perderían al cerrar)
+            self._datos_editados = False
 
             # Variables para análisis comparativo
-            self.tree_eficiencia = None
+            self.tabla_eficiencia = None
             self.text_temporal = None
             self.kpi_vars = {}
+            self._kpi_ultimos: Dict[str, str] = {}
+
+            # Balanceamiento en curso; una ejecución a la vez
+            self._trabajo_en_curso = False
+            self._etapa_programada = None  # id de after de la próxima etapa
 
             self._configurar_ventana()
             self._crear_interfaz()
@@ -57,7 +179,7 @@ class VentanaPrincipal:
 
         except Exception as e:
             # Manejo seguro de errores durante inicialización
-            if hasattr(self, 'root'):
+            if self.root is not None:
                 try:
                     messagebox.showerror("Error de Inicialización",
                                        f"Error al inicializar la aplicación:\n\n{str(e)}")
@@ -81,21 +203,25 @@ class VentanaPrincipal:
             except:
                 UtilsUI.centrar_ventana(self.root, 1400, 900)
         
-        # Configurar ícono (si existe)
-        try:
-            self.root.iconbitmap('assets/icon.ico')
-        except:
-            pass  # Continuar sin ícono si no existe
+        # Configurar ícono (si existe) tras el primer pintado
+        self.root.after_idle(self._configurar_icono)
         
         # Configurar colores de fondo
         self.root.configure(bg=COLORES['fondo'])
         
         # Configurar tema moderno
-        EstilosModernos.configurar_tema_principal()
+        EstilosModernos.asegurar_tema_principal()
         
         # Configurar protocolo de cierre
         self.root.protocol("WM_DELETE_WINDOW", self._on_cerrar_aplicacion)
     
+    def _configurar_icono(self):
+        """Asigna el ícono de la ventana, si el archivo existe."""
+        try:
+            self.root.iconbitmap('assets/icon.ico')
+        except:
+            pass  # Continuar sin ícono si no existe
+    
     def _crear_interfaz(self):
         """Crea la interfaz principal."""
         # Frame principal
@@ -200,6 +326,21 @@ class VentanaPrincipal:
 
         # Pestaña 5: Vista Previa de Reporte
         self._crear_pestana_vista_previa()
+
+        # Construir el contenido diferido al seleccionar cada pestaña
+        self.notebook_principal.bind('<<NotebookTabChanged>>', self._on_pestana_cambiada)
+
+    def _on_pestana_cambiada(self, event=None):
+        """Construye el contenido de la pestaña seleccionada si aún no existe."""
+        constructor = self._constructores_pestanas.pop(self.notebook_principal.select(), None)
+        if constructor is not None:
+            constructor()
+
+    def _construir_pestanas_pendientes(self):
+        """Construye todas las pestañas diferidas; se usa antes de publicar resultados."""
+        while self._constructores_pestanas:
+            _, constructor = self._constructores_pestanas.popitem()
+            constructor()
     
     def _crear_pestana_configuracion(self):
         """Crea la pestaña de configuración y entrada de datos."""
@@ -214,8 +355,10 @@ class VentanaPrincipal:
         frame_resultados = ttk.Frame(self.notebook_principal, style='Fondo.TFrame')
         self.notebook_principal.add(frame_resultados, text="📊 Resultados")
 
-        # Panel de resultados ocupa toda la pestaña
-        self.panel_resultados = PanelResultados(frame_resultados)
+        # Panel de resultados ocupa toda la pestaña; se crea al mostrarla
+        def construir():
+            self.panel_resultados = PanelResultados(frame_resultados)
+        self._constructores_pestanas[str(frame_resultados)] = construir
 
     def _crear_pestana_analisis_comparativo(self):
         """Crea la pestaña de análisis comparativo."""
@@ -230,8 +373,10 @@ class VentanaPrincipal:
         frame_metricas = ttk.Frame(self.notebook_principal, style='Fondo.TFrame')
         self.notebook_principal.add(frame_metricas, text="📈 Métricas Visuales")
 
-        # Panel de gráficos y métricas visuales ocupa toda la pestaña
-        self.panel_graficos = PanelGraficos(frame_metricas)
+        # Panel de gráficos y métricas visuales ocupa toda la pestaña; se crea al mostrarla
+        def construir():
+            self.panel_graficos = PanelGraficos(frame_metricas)
+        self._constructores_pestanas[str(frame_metricas)] = construir
 
     def _crear_pestana_vista_previa(self):
         """Crea la pestaña de vista previa de reporte PDF."""
@@ -266,33 +411,9 @@ class VentanaPrincipal:
 
     def _inicializar_analisis_eficiencia(self, parent):
         """Inicializa el análisis de eficiencia por estación."""
-        # Crear tabla de eficiencia por estación
-        columns = ('Estación', 'Tareas', 'Tiempo Total', 'Utilización %', 'Tiempo Ocioso', 'Estado')
-        self.tree_eficiencia = ttk.Treeview(parent, columns=columns, show='headings', height=8)
-
-        # Configurar encabezados
-        self.tree_eficiencia.heading('Estación', text='Estación')
-        self.tree_eficiencia.heading('Tareas', text='Tareas Asignadas')
-        self.tree_eficiencia.heading('Tiempo Total', text='Tiempo Total (min)')
-        self.tree_eficiencia.heading('Utilización %', text='Utilización %')
-        self.tree_eficiencia.heading('Tiempo Ocioso', text='Tiempo Ocioso (min)')
-        self.tree_eficiencia.heading('Estado', text='Estado')
-
-        # Configurar anchos de columnas
-        self.tree_eficiencia.column('Estación', width=80)
-        self.tree_eficiencia.column('Tareas', width=150)
-        self.tree_eficiencia.column('Tiempo Total', width=120)
-        self.tree_eficiencia.column('Utilización %', width=100)
-        self.tree_eficiencia.column('Tiempo Ocioso', width=120)
-        self.tree_eficiencia.column('Estado', width=100)
-
-        # Scrollbar para la tabla
-        scrollbar_ef = ttk.Scrollbar(parent, orient='vertical', command=self.tree_eficiencia.yview)
-        self.tree_eficiencia.configure(yscrollcommand=scrollbar_ef.set)
-
-        # Pack de componentes
-        self.tree_eficiencia.pack(side='left', fill='both', expand=True)
-        scrollbar_ef.pack(side='right', fill='y')
+        # Crear tabla de eficiencia por estación (virtual para líneas con muchas estaciones)
+        self.tabla_eficiencia = TablaVirtual(parent, _COLUMNAS_EFICIENCIA, altura=8)
+        self.tabla_eficiencia.pack()
 
     def _inicializar_analisis_temporal(self, parent):
         """Inicializa el análisis temporal."""
@@ -322,16 +443,8 @@ class VentanaPrincipal:
 
         # Crear grid de KPIs (2x3)
         self.kpi_vars = {}
-        kpis = [
-            ('eficiencia_linea', 'Eficiencia de Línea', '%'),
-            ('balance_suavidad', 'Balance de Suavidad', ''),
-            ('tiempo_ocioso_total', 'Tiempo Ocioso Total', 'min'),
-            ('estaciones_optimas', 'Desviación vs Óptimo', 'estaciones'),
-            ('capacidad_produccion', 'Capacidad de Producción', 'und/día'),
-            ('indice_productividad', 'Índice de Productividad', '')
-        ]
 
-        for i, (key, nombre, unidad) in enumerate(kpis):
+        for i, (key, nombre, unidad) in enumerate(_ESPECIFICACION_KPIS):
             row = i // 2
             col = i % 2
 
@@ -341,8 +454,9 @@ class VentanaPrincipal:
                           sticky='ew')
 
             # Variable para el valor
-            var = tk.StringVar(value="--")
+            var = tk.StringVar(value=_KPI_DEFAULT)
             self.kpi_vars[key] = var
+            self._kpi_ultimos[key] = _KPI_DEFAULT
 
             # Label para el valor
             valor_label = ttk.Label(kpi_frame, textvariable=var, style='Titulo.TLabel')
@@ -370,35 +484,37 @@ class VentanaPrincipal:
 
     def _actualizar_eficiencia_estaciones(self, estaciones):
         """Actualiza la tabla de eficiencia por estación."""
-        # Limpiar tabla existente
-        for item in self.tree_eficiencia.get_children():
-            self.tree_eficiencia.delete(item)
-
-        # Agregar datos de cada estación
-        for estacion in estaciones:
-            utilizacion = estacion.calcular_utilizacion()
-            tiempo_ocioso = estacion.obtener_tiempo_ocioso()
-            tareas_texto = ", ".join(estacion.obtener_ids_tareas())
-
-            # Determinar estado basado en utilización
-            if utilizacion >= 90:
-                estado = "🔴 Sobrecargada"
-            elif utilizacion >= 75:
-                estado = "🟡 Alta"
-            elif utilizacion >= 50:
-                estado = "🟢 Óptima"
-            else:
-                estado = "🔵 Baja"
-
-            # Insertar fila
-            self.tree_eficiencia.insert('', 'end', values=(
+        if not estaciones:
+            self.tabla_eficiencia.limpiar()
+            return
+
+        # Utilización y tiempo ocioso de todas las estaciones en una sola pasada vectorizada
+        tiempo_ciclo = estaciones[0].tiempo_ciclo_max
+        tiempos = np.fromiter((estacion.tiempo_total for estacion in estaciones),
+                              dtype=np.float64, count=len(estaciones))
+        utilizaciones = calcular_utilizaciones(tiempos, tiempo_ciclo)
+        ociosos = np.maximum(tiempo_ciclo - tiempos, 0.0)
+
+        # Determinar estado basado en utilización: índice = umbrales superados
+        indices_estado = np.searchsorted(_UMBRALES_ESTADO_ESTACION, utilizaciones, side='right')
+
+        # Preparar todas las filas antes de tocar el widget
+        filas = [
+            (
                 f"Estación {estacion.numero}",
-                tareas_texto,
-                f"{estacion.tiempo_total:.2f}",
+                estacion.obtener_ids_tareas_texto(),
+                f"{tiempo:.2f}",
                 f"{utilizacion:.1f}%",
-                f"{tiempo_ocioso:.2f}",
-                estado
-            ))
+                f"{ocioso:.2f}",
+                _ESTADOS_ESTACION[indice_estado]
+            )
+            for estacion, tiempo, utilizacion, ocioso, indice_estado
+            in zip(estaciones, tiempos.tolist(), utilizaciones.tolist(), ociosos.tolist(),
+                   indices_estado.tolist())
+        ]
+
+        # La tabla solo materializa las filas visibles cuando son muchas
+        self.tabla_eficiencia.establecer_filas(filas)
 
     def _actualizar_analisis_temporal(self, metricas):
         """Actualiza el análisis temporal."""
@@ -406,44 +522,53 @@ class VentanaPrincipal:
         eficiencia = metricas.get('metricas_eficiencia', {})
         basicas = metricas.get('metricas_basicas', {})
 
-        texto_analisis = f"""
+        eficiencia_linea = eficiencia.get('eficiencia_linea', 0)
+        indice_suavidad = eficiencia.get('indice_suavidad', 0)
+        numero_estaciones = basicas.get('numero_estaciones', 0)
+        minimo_teorico = basicas.get('numero_estaciones_minimo_teorico', 0)
+        tiempo_ocioso = eficiencia.get('tiempo_ocioso_total', 0)
+        utilizacion_promedio = eficiencia.get('utilizacion_promedio', 0)
+        tiempo_ciclo = basicas.get('tiempo_ciclo', 0)
+        demanda = basicas.get('demanda_diaria', 0)
+
+        partes = [f"""
 📊 ANÁLISIS TEMPORAL Y TENDENCIAS
 
-⏱️  Tiempo de Ciclo: {basicas.get('tiempo_ciclo', 0):.2f} minutos
-🎯 Demanda Objetivo: {basicas.get('demanda_diaria', 0)} unidades/día
-📈 Eficiencia Alcanzada: {eficiencia.get('eficiencia_linea', 0):.1f}%
+⏱️  Tiempo de Ciclo: {tiempo_ciclo:.2f} minutos
+🎯 Demanda Objetivo: {demanda} unidades/día
+📈 Eficiencia Alcanzada: {eficiencia_linea:.1f}%
 
 🔍 EVALUACIÓN DE RENDIMIENTO:
-• Número de estaciones utilizadas: {basicas.get('numero_estaciones', 0)}
-• Estaciones mínimas teóricas: {basicas.get('numero_estaciones_minimo_teorico', 0)}
-• Diferencia: +{basicas.get('numero_estaciones', 0) - basicas.get('numero_estaciones_minimo_teorico', 0)} estaciones
+• Número de estaciones utilizadas: {numero_estaciones}
+• Estaciones mínimas teóricas: {minimo_teorico}
+• Diferencia: +{numero_estaciones - minimo_teorico} estaciones
 
 ⚖️  BALANCE Y EQUILIBRIO:
-• Índice de suavidad: {eficiencia.get('indice_suavidad', 0):.2f}
-• Tiempo ocioso total: {eficiencia.get('tiempo_ocioso_total', 0):.2f} minutos
-• Utilización promedio: {eficiencia.get('utilizacion_promedio', 0):.1f}%
+• Índice de suavidad: {indice_suavidad:.2f}
+• Tiempo ocioso total: {tiempo_ocioso:.2f} minutos
+• Utilización promedio: {utilizacion_promedio:.1f}%
 
 📋 RECOMENDACIONES:
-"""
+"""]
 
         # Agregar recomendaciones basadas en métricas
-        if eficiencia.get('eficiencia_linea', 0) < 70:
-            texto_analisis += "• ⚠️  Eficiencia baja - Considerar redistribución de tareas\n"
-        if eficiencia.get('indice_suavidad', 0) > 2.0:
-            texto_analisis += "• ⚠️  Desbalance alto - Revisar asignaciones por tiempo\n"
-        if basicas.get('numero_estaciones', 0) > basicas.get('numero_estaciones_minimo_teorico', 0) + 2:
-            texto_analisis += "• ⚠️  Exceso de estaciones - Optimización posible\n"
-
-        if eficiencia.get('eficiencia_linea', 0) >= 85:
-            texto_analisis += "• ✅ Excelente eficiencia alcanzada\n"
-        if eficiencia.get('indice_suavidad', 0) <= 1.0:
-            texto_analisis += "• ✅ Buen balance entre estaciones\n"
-
-        # Actualizar widget de texto
-        self.text_temporal.configure(state='normal')
-        self.text_temporal.delete('1.0', tk.END)
-        self.text_temporal.insert('1.0', texto_analisis)
-        self.text_temporal.configure(state='disabled')
+        if eficiencia_linea < 70:
+            partes.append("• ⚠️  Eficiencia baja - Considerar redistribución de tareas\n")
+        if indice_suavidad > 2.0:
+            partes.append("• ⚠️  Desbalance alto - Revisar asignaciones por tiempo\n")
+        if numero_estaciones > minimo_teorico + 2:
+            partes.append("• ⚠️  Exceso de estaciones - Optimización posible\n")
+
+        if eficiencia_linea >= 85:
+            partes.append("• ✅ Excelente eficiencia alcanzada\n")
+        if indice_suavidad <= 1.0:
+            partes.append("• ✅ Buen balance entre estaciones\n")
+
+        # Actualizar widget de texto con un único reemplazo
+        texto = self.text_temporal
+        texto.configure(state='normal')
+        texto.replace('1.0', tk.END, "".join(partes))
+        texto.configure(state='disabled')
 
     def _actualizar_kpis(self, metricas):
         """Actualiza los indicadores clave de rendimiento."""
@@ -451,43 +576,52 @@ class VentanaPrincipal:
         basicas = metricas.get('metricas_basicas', {})
         produccion = metricas.get('metricas_produccion', {})
 
+        eficiencia_linea = eficiencia.get('eficiencia_linea', 0)
+
         # Actualizar valores de KPIs
-        self.kpi_vars['eficiencia_linea'].set(f"{eficiencia.get('eficiencia_linea', 0):.1f}")
-        self.kpi_vars['balance_suavidad'].set(f"{eficiencia.get('indice_suavidad', 0):.2f}")
-        self.kpi_vars['tiempo_ocioso_total'].set(f"{eficiencia.get('tiempo_ocioso_total', 0):.1f}")
+        establecer = self._establecer_kpi
+        establecer('eficiencia_linea', f"{eficiencia_linea:.1f}")
+        establecer('balance_suavidad', f"{eficiencia.get('indice_suavidad', 0):.2f}")
+        establecer('tiempo_ocioso_total', f"{eficiencia.get('tiempo_ocioso_total', 0):.1f}")
 
         # Calcular desviación vs óptimo
         actual = basicas.get('numero_estaciones', 0)
         optimo = basicas.get('numero_estaciones_minimo_teorico', 0)
         desviacion = actual - optimo
-        self.kpi_vars['estaciones_optimas'].set(f"+{desviacion}" if desviacion > 0 else f"{desviacion}")
+        establecer('estaciones_optimas', f"+{desviacion}" if desviacion > 0 else f"{desviacion}")
 
         # Capacidad de producción
-        capacidad = produccion.get('capacidad_maxima_diaria', basicas.get('demanda_diaria', 0))
-        self.kpi_vars['capacidad_produccion'].set(f"{capacidad:.0f}")
+        capacidad = produccion.get('capacidad_maxima_diaria')
+        if capacidad is None:
+            capacidad = basicas.get('demanda_diaria', 0)
+        establecer('capacidad_produccion', f"{capacidad:.0f}")
 
         # Índice de productividad (eficiencia normalizada)
-        productividad = eficiencia.get('eficiencia_linea', 0) / 100
-        self.kpi_vars['indice_productividad'].set(f"{productividad:.2f}")
+        productividad = eficiencia_linea / 100
+        establecer('indice_productividad', f"{productividad:.2f}")
+
+    def _establecer_kpi(self, clave: str, valor: str):
+        """Asigna el valor de un KPI solo si cambió respecto al último mostrado."""
+        if self._kpi_ultimos.get(clave) != valor:
+            self._kpi_ultimos[clave] = valor
+            self.kpi_vars[clave].set(valor)
 
     def _limpiar_analisis_comparativo(self):
         """Limpia los datos del análisis comparativo."""
         # Limpiar tabla de eficiencia
-        if hasattr(self, 'tree_eficiencia'):
-            for item in self.tree_eficiencia.get_children():
-                self.tree_eficiencia.delete(item)
+        if self.tabla_eficiencia is not None:
+            self.tabla_eficiencia.limpiar()
 
         # Limpiar análisis temporal
-        if hasattr(self, 'text_temporal'):
-            self.text_temporal.configure(state='normal')
-            self.text_temporal.delete('1.0', tk.END)
-            self.text_temporal.insert('1.0', "No hay datos de análisis disponibles.\n\nEjecute el balanceamiento para ver el análisis.")
-            self.text_temporal.configure(state='disabled')
+        texto = self.text_temporal
+        if texto is not None:
+            texto.configure(state='normal')
+            texto.replace('1.0', tk.END, _PLACEHOLDER_TEMPORAL)
+            texto.configure(state='disabled')
 
         # Resetear KPIs
-        if hasattr(self, 'kpi_vars'):
-            for var in self.kpi_vars.values():
-                var.set("--")
+        for clave in self.kpi_vars:
+            self._establecer_kpi(clave, _KPI_DEFAULT)
     
     def _crear_barra_estado(self, parent):
         """Crea la barra de estado."""
@@ -505,9 +639,7 @@ class VentanaPrincipal:
         self.label_estado.pack(side='left')
         
         # Barra de progreso
-        self.progreso_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(frame_estado, 
-                                           variable=self.progreso_var,
                                            maximum=100,
                                            length=200)
         self.progress_bar.pack(side='right', padx=(10, 0))
@@ -525,7 +657,11 @@ class VentanaPrincipal:
         self.root.bind('<F1>', lambda e: self._mostrar_ayuda())
         self.root.bind('<Escape>', lambda e: self._on_cerrar_aplicacion())
         
-        # Configurar tooltips
+        # Los tooltips no son necesarios para el primer pintado
+        self.root.after_idle(self._configurar_tooltips)
+    
+    def _configurar_tooltips(self):
+        """Registra los tooltips de los botones principales."""
         EstilosModernos.crear_tooltip(self.btn_balancear, "Ctrl+R: Ejecutar balanceamiento con algoritmo RPW")
         EstilosModernos.crear_tooltip(self.btn_limpiar, "Ctrl+L: Limpiar todos los resultados")
         EstilosModernos.crear_tooltip(self.btn_vista_previa, "Vista previa y exportación de reporte PDF")
@@ -534,77 +670,119 @@ class VentanaPrincipal:
     def _on_datos_actualizados(self):
         """Callback cuando se actualizan los datos de entrada."""
         self.datos_balanceados = False
+        self._datos_editados = True
         self._actualizar_estado("Datos actualizados - Ejecute el balanceamiento para ver resultados")
     
     def _ejecutar_balanceamiento(self):
         """Ejecuta el algoritmo de balanceamiento RPW."""
+        # Ignorar nuevas ejecuciones mientras una sigue en curso
+        if self._trabajo_en_curso:
+            return
+
         try:
             # Validar datos de entrada
-            if not self._validar_datos_entrada():
+            entrada = self._validar_datos_entrada()
+            if entrada is None:
                 return
             
-            # Actualizar estado
+            # Actualizar estado (_actualizar_estado ya vacía las tareas idle pendientes)
+            self._establecer_progreso(10)
             self._actualizar_estado("Iniciando balanceamiento...")
-            self.progreso_var.set(10)
-            self.root.update()
             
-            # Crear línea de producción
-            self._crear_linea_produccion()
-            self.progreso_var.set(30)
-            self.root.update()
+            # Crear línea de producción con los datos ya leídos en la validación
+            self._crear_linea_produccion(*entrada)
             
-            # Ejecutar balanceamiento en hilo separado para no bloquear UI
-            threading.Thread(target=self._ejecutar_balanceamiento_async, daemon=True).start()
+            # Ejecutar las etapas del balanceamiento desde el bucle de eventos, una por turno
+            self._trabajo_en_curso = True
+            self.btn_balancear.configure(state='disabled')
+            self._etapa_programada = self.root.after(1, self._avanzar_balanceamiento,
+                                                     self._etapas_balanceamiento())
             
         except Exception as e:
             self._manejar_error("Error al iniciar balanceamiento", str(e))
     
-    def _ejecutar_balanceamiento_async(self):
-        """Ejecuta el balanceamiento de forma asíncrona."""
+    def _terminar_trabajo(self):
+        """Marca el balanceamiento como terminado y rehabilita el botón."""
+        self._trabajo_en_curso = False
+        self.btn_balancear.configure(state='normal')
+    
+    def _fallo_balanceamiento(self, mensaje: str):
+        """Termina un balanceamiento fallido y muestra el error."""
+        self._terminar_trabajo()
+        self._manejar_error("Error durante balanceamiento", mensaje)
+    
+    def _etapas_balanceamiento(self):
+        """
+        Generador con las etapas del balanceamiento.
+        Cada yield entrega (progreso, mensaje) y devuelve el control al bucle de
+        eventos; al terminar retorna (estaciones, metricas).
+        """
+        # Referencias locales: entre etapas el bucle de eventos puede modificar self
+        linea = self.linea_produccion
+
+        # Crear balanceador, o reutilizar el de la ejecución anterior
+        balanceador = self.balanceador
+        if balanceador is None:
+            balanceador = self.balanceador = BalanceadorRPW(linea)
+        else:
+            balanceador.reset(linea)
+        
+        # Actualizar progreso
+        yield 50, "Calculando pesos posicionales..."
+        
+        # Ejecutar balanceamiento
+        estaciones, estadisticas = balanceador.balancear()
+        
+        # Actualizar progreso
+        yield 70, "Calculando métricas..."
+        
+        # Calcular métricas completas
+        calculadora = self.calculadora_metricas = CalculadoraMetricas(linea)
+        metricas_completas = calculadora.calcular_todas_las_metricas()
+        
+        # Actualizar progreso
+        yield 90, "Actualizando interfaz..."
+        
+        return estaciones, metricas_completas
+    
+    def _avanzar_balanceamiento(self, etapas):
+        """Ejecuta la siguiente etapa del balanceamiento y programa la próxima."""
+        self._etapa_programada = None
         try:
-            # Crear balanceador
-            self.balanceador = BalanceadorRPW(self.linea_produccion)
-            
-            # Actualizar progreso
-            self.root.after(0, lambda: self.progreso_var.set(50))
-            self.root.after(0, lambda: self._actualizar_estado("Calculando pesos posicionales..."))
-            
-            # Ejecutar balanceamiento
-            estaciones, estadisticas = self.balanceador.balancear()
-            
-            # Actualizar progreso
-            self.root.after(0, lambda: self.progreso_var.set(70))
-            self.root.after(0, lambda: self._actualizar_estado("Calculando métricas..."))
-            
-            # Calcular métricas completas
-            self.calculadora_metricas = CalculadoraMetricas(self.linea_produccion)
-            metricas_completas = self.calculadora_metricas.calcular_todas_las_metricas()
-            
-            # Actualizar progreso
-            self.root.after(0, lambda: self.progreso_var.set(90))
-            self.root.after(0, lambda: self._actualizar_estado("Actualizando interfaz..."))
-            
-            # Actualizar UI en el hilo principal
-            self.root.after(0, lambda: self._finalizar_balanceamiento(estaciones, metricas_completas))
-            
+            progreso, mensaje = next(etapas)
+        except StopIteration as fin:
+            self._finalizar_balanceamiento(*fin.value)
+            return
         except Exception as e:
-            self.root.after(0, lambda: self._manejar_error("Error durante balanceamiento", str(e)))
-    
+            self._fallo_balanceamiento(str(e))
+            return
+        
+        self._aplicar_etapa(progreso, mensaje)
+        self._etapa_programada = self.root.after(1, self._avanzar_balanceamiento, etapas)
+
+    def _aplicar_etapa(self, progreso: float, mensaje: str):
+        """Aplica el progreso y el estado de una etapa."""
+        self._establecer_progreso(progreso)
+        self._actualizar_estado(mensaje)
+
     def _finalizar_balanceamiento(self, estaciones, metricas):
         """Finaliza el balanceamiento y actualiza la UI."""
         try:
+            # Los paneles diferidos deben existir para recibir los resultados
+            self._construir_pestanas_pendientes()
+
             # Actualizar paneles principales
-            if hasattr(self, 'panel_resultados') and self.panel_resultados:
+            if self.panel_resultados is not None:
                 self.panel_resultados.actualizar_resultados(estaciones, metricas)
 
-            if hasattr(self, 'panel_graficos') and self.panel_graficos:
+            if self.panel_graficos is not None:
                 self.panel_graficos.actualizar_graficos(estaciones, metricas)
 
             # Actualizar análisis comparativo en su pestaña dedicada
             self._actualizar_analisis_comparativo(estaciones, metricas)
 
             # Actualizar datos en vista previa PDF
-            if hasattr(self, 'panel_vista_previa') and self.panel_vista_previa:
+            if self.panel_vista_previa is not None:
                 self.panel_vista_previa.actualizar_datos(self.linea_produccion, estaciones, metricas)
 
             # Marcar como balanceado
@@ -615,86 +793,93 @@ class VentanaPrincipal:
             eficiencia = metricas.get('metricas_eficiencia', {}).get('eficiencia_linea', 0)
 
             mensaje_final = f"✅ Balanceamiento completado: {num_estaciones} estaciones, {eficiencia:.1f}% eficiencia"
-            self._actualizar_estado(mensaje_final)
+            self._actualizar_estado(mensaje_final, forzar=True)
 
             # Completar barra de progreso
-            self.progreso_var.set(100)
+            self._establecer_progreso(100)
 
             # Cambiar automáticamente a la pestaña de resultados
-            if hasattr(self, 'notebook_principal'):
+            if self.notebook_principal is not None:
                 self.notebook_principal.select(1)  # Índice 1 = pestaña de resultados
 
             # Limpiar progreso después de un momento
-            self.root.after(3000, lambda: self.progreso_var.set(0))
+            self.root.after(3000, self._establecer_progreso, 0)
 
             # Mostrar resumen
+            self._terminar_trabajo()
             self._mostrar_resumen_balanceamiento(estaciones, metricas)
             
         except Exception as e:
+            self._terminar_trabajo()
             self._manejar_error("Error al finalizar balanceamiento", str(e))
     
-    def _validar_datos_entrada(self) -> bool:
-        """Valida que los datos de entrada sean correctos."""
+    def _validar_datos_entrada(self) -> Optional[Tuple[List[Dict], Dict]]:
+        """
+        Valida que los datos de entrada sean correctos.
+        Retorna (datos_tareas, config_linea) si son válidos, o None si no lo son.
+        """
+        # Obtener datos (única lectura de los widgets por ejecución)
         try:
-            # Obtener datos
             datos_tareas = self.panel_entrada.obtener_datos_tareas()
             config_linea = self.panel_entrada.obtener_configuracion_linea()
-            
-            # Validaciones básicas
-            if not datos_tareas:
-                messagebox.showerror("Error de Validación", "Debe definir al menos una tarea")
-                return False
-            
-            if config_linea['demanda_diaria'] <= 0:
-                messagebox.showerror("Error de Validación", "La demanda diaria debe ser mayor a 0")
-                return False
-            
-            if config_linea['tiempo_disponible'] <= 0:
-                messagebox.showerror("Error de Validación", "El tiempo disponible debe ser mayor a 0")
-                return False
-            
-            return True
-            
         except Exception as e:
             messagebox.showerror("Error de Validación", f"Error al validar datos: {str(e)}")
-            return False
-    
-    def _crear_linea_produccion(self):
-        """Crea la línea de producción con los datos ingresados."""
-        # Obtener configuración
-        config = self.panel_entrada.obtener_configuracion_linea()
+            return None
         
-        # Crear línea de producción
-        self.linea_produccion = LineaProduccion(
-            demanda_diaria=config['demanda_diaria'],
-            tiempo_disponible=config['tiempo_disponible']
-        )
+        # Validaciones básicas; todos los errores se muestran en un único diálogo
+        errores = []
+        for validador in _VALIDADORES_ENTRADA:
+            valido, mensaje = validador(datos_tareas, config_linea)
+            if not valido:
+                errores.append(mensaje)
         
-        # Agregar tareas
-        datos_tareas = self.panel_entrada.obtener_datos_tareas()
-        for datos in datos_tareas:
-            tarea = Tarea(
+        if errores:
+            messagebox.showerror("Error de Validación", "\n".join(errores))
+            return None
+        
+        return datos_tareas, config_linea
+    
+    def _crear_linea_produccion(self, datos_tareas: List[Dict], config: Dict):
+        """Crea la línea de producción con los datos ingresados y validados."""
+        # Construir las tareas en un solo paso
+        tareas = [
+            Tarea(
                 id=datos['id'],
                 descripcion=datos['descripcion'],
                 tiempo=datos['tiempo'],
                 precedencias=datos.get('precedencias', [])
             )
-            self.linea_produccion.agregar_tarea(tarea)
+            for datos in datos_tareas
+        ]
+        
+        # Crear una línea nueva en cada ejecución: la anterior puede seguir en uso
+        # por la vista previa PDF, que la lee desde su hilo de trabajo
+        self.linea_produccion = LineaProduccion(
+            demanda_diaria=config['demanda_diaria'],
+            tiempo_disponible=config['tiempo_disponible']
+        )
+        self.linea_produccion.agregar_tareas(tareas)
 
     def _limpiar_resultados(self):
         """Limpia todos los resultados y datos."""
         try:
+            # Cancelar un balanceamiento en curso entre etapas
+            if self._etapa_programada is not None:
+                self.root.after_cancel(self._etapa_programada)
+                self._etapa_programada = None
+                self._terminar_trabajo()
+
             # Limpiar paneles solo si están inicializados
-            if hasattr(self, 'panel_resultados') and self.panel_resultados:
+            if self.panel_resultados is not None:
                 self.panel_resultados.limpiar_resultados()
-            if hasattr(self, 'panel_graficos') and self.panel_graficos:
+            if self.panel_graficos is not None:
                 self.panel_graficos.limpiar_graficos()
 
             # Limpiar análisis comparativo
             self._limpiar_analisis_comparativo()
 
             # Limpiar vista previa PDF
-            if hasattr(self, 'panel_vista_previa') and self.panel_vista_previa:
+            if self.panel_vista_previa is not None:
                 self.panel_vista_previa.limpiar_vista_previa()
 
             # Resetear estado
@@ -704,10 +889,9 @@ class VentanaPrincipal:
             self.calculadora_metricas = None
 
             # Actualizar estado solo si está inicializado
-            if hasattr(self, 'label_estado') and self.label_estado:
+            if self.label_estado is not None:
                 self._actualizar_estado("Resultados limpiados - Configure nuevos datos")
-            if hasattr(self, 'progreso_var') and self.progreso_var:
-                self.progreso_var.set(0)
+            self._establecer_progreso(0)
 
         except Exception as e:
             self._manejar_error_seguro("Error al limpiar resultados", str(e))
@@ -719,12 +903,12 @@ class VentanaPrincipal:
                 messagebox.showinfo("Vista Previa PDF",
                                    "Complete el balanceamiento primero para generar la vista previa del reporte.")
                 # Cambiar a la pestaña de configuración
-                if hasattr(self, 'notebook_principal'):
+                if self.notebook_principal is not None:
                     self.notebook_principal.select(0)
                 return
 
             # Cambiar a la pestaña de vista previa
-            if hasattr(self, 'notebook_principal'):
+            if self.notebook_principal is not None:
                 self.notebook_principal.select(4)  # Índice 4 = pestaña de vista previa
 
         except Exception as e:
@@ -739,53 +923,28 @@ class VentanaPrincipal:
             ventana_ayuda.geometry("800x600")
             ventana_ayuda.configure(bg=COLORES['fondo'])
 
-            # Contenido de ayuda
-            texto_ayuda = """
-CALCULADORA DE BALANCEAMIENTO DE LÍNEAS - ALGORITMO RPW
-
-¿Qué es el algoritmo RPW?
-El algoritmo Ranked Positional Weight (RPW) es un método heurístico para
-balancear líneas de producción. Asigna tareas a estaciones de trabajo
-minimizando el número de estaciones necesarias.
-
-Cómo usar la aplicación:
-1. Configure la demanda diaria y tiempo disponible
-2. Agregue tareas con sus tiempos y precedencias
-3. Ejecute el balanceamiento (Ctrl+R)
-4. Analice los resultados y gráficos
-5. Exporte los resultados si es necesario
-
-Atajos de teclado:
-- Ctrl+R: Ejecutar balanceamiento
-- Ctrl+L: Limpiar resultados
-- Ctrl+S: Exportar resultados
-- F1: Mostrar esta ayuda
-- Esc: Cerrar aplicación
-
-Métricas importantes:
-- Eficiencia de línea: % de utilización promedio de las estaciones
-- Tiempo de ciclo: Tiempo máximo disponible por estación
-- Balance de suavidad: Medida de equilibrio entre estaciones
-            """
-
             # Widget de texto con scroll
             frame_texto = ttk.Frame(ventana_ayuda, padding=20)
             frame_texto.pack(fill='both', expand=True)
 
+            # Texto de solo lectura: sin historial de deshacer
             text_widget = tk.Text(frame_texto,
                                 wrap='word',
                                 font=FUENTES['normal'],
                                 bg=COLORES['superficie'],
-                                fg=COLORES['texto_primario'])
+                                fg=COLORES['texto_primario'],
+                                undo=False,
+                                autoseparators=False)
             scrollbar = ttk.Scrollbar(frame_texto, orient='vertical', command=text_widget.yview)
             text_widget.configure(yscrollcommand=scrollbar.set)
 
+            # Cargar el contenido antes de empaquetar para un único cálculo de geometría
+            text_widget.insert('1.0', _TEXTO_AYUDA)
+            text_widget.configure(state='disabled')
+
             text_widget.pack(side='left', fill='both', expand=True)
             scrollbar.pack(side='right', fill='y')
 
-            text_widget.insert('1.0', texto_ayuda)
-            text_widget.configure(state='disabled')
-
             # Botón cerrar
             btn_cerrar = ttk.Button(ventana_ayuda,
                                   text="Cerrar",
@@ -801,47 +960,55 @@ Métricas importantes:
             eficiencia = metricas.get('metricas_eficiencia', {}).get('eficiencia_linea', 0)
             num_estaciones = len(estaciones)
 
-            mensaje = f"""
-✅ BALANCEAMIENTO COMPLETADO
-
-📊 Resultados:
-• Número de estaciones: {num_estaciones}
-• Eficiencia de línea: {eficiencia:.1f}%
-• Tiempo de ciclo: {self.linea_produccion.obtener_tiempo_ciclo():.2f} min
-
-💡 Los resultados se muestran en los paneles de la derecha.
-Puede exportar el reporte completo usando Ctrl+S.
-            """
+            mensaje = _PLANTILLA_RESUMEN.format(
+                num_estaciones=num_estaciones,
+                eficiencia=eficiencia,
+                tiempo_ciclo=self.linea_produccion.obtener_tiempo_ciclo()
+            )
 
             messagebox.showinfo("Balanceamiento Completado", mensaje)
 
         except Exception as e:
             print(f"Error al mostrar resumen: {e}")  # Log sin mostrar al usuario
 
-    def _actualizar_estado(self, mensaje: str):
-        """Actualiza el mensaje de estado."""
-        self.label_estado.configure(text=mensaje)
-        self.root.update_idletasks()
+    def _establecer_progreso(self, valor: float):
+        """Escribe el progreso directamente en la barra, solo si cambió."""
+        if self.progress_bar is not None and valor != self._ultimo_progreso:
+            self._ultimo_progreso = valor
+            self.progress_bar['value'] = valor
+
+    def _actualizar_estado(self, mensaje: str, forzar: bool = False):
+        """
+        Actualiza el mensaje de estado.
+        El repintado inmediato se limita a uno cada _INTERVALO_VACIADO_ESTADO
+        segundos, salvo que se pida con `forzar` (mensajes finales y errores).
+        """
+        if mensaje != self._ultimo_estado:
+            self._ultimo_estado = mensaje
+            self.label_estado.configure(text=mensaje)
+
+        ahora = time.monotonic()
+        if forzar or ahora - self._ultimo_vaciado_estado > _INTERVALO_VACIADO_ESTADO:
+            self._ultimo_vaciado_estado = ahora
+            self.root.update_idletasks()
 
     def _manejar_error(self, titulo: str, mensaje: str):
         """Maneja errores de la aplicación."""
-        if hasattr(self, 'progreso_var') and self.progreso_var:
-            self.progreso_var.set(0)
-        if hasattr(self, 'label_estado') and self.label_estado:
-            self._actualizar_estado(f"❌ Error: {mensaje}")
+        self._establecer_progreso(0)
+        if self.label_estado is not None:
+            self._actualizar_estado(f"❌ Error: {mensaje}", forzar=True)
         messagebox.showerror(titulo, f"Ha ocurrido un error:\n\n{mensaje}")
 
     def _manejar_error_seguro(self, titulo: str, mensaje: str):
         """Maneja errores de forma segura, incluso si la UI no está completamente inicializada."""
         try:
             # Intentar usar el manejo normal de errores
-            if hasattr(self, 'progreso_var') and self.progreso_var:
-                self.progreso_var.set(0)
-            if hasattr(self, 'label_estado') and self.label_estado:
-                self._actualizar_estado(f"❌ Error: {mensaje}")
+            self._establecer_progreso(0)
+            if self.label_estado is not None:
+                self._actualizar_estado(f"❌ Error: {mensaje}", forzar=True)
 
             # Mostrar mensaje de error
-            if hasattr(self, 'root') and self.root:
+            if self.root is not None:
                 messagebox.showerror(titulo, f"Ha ocurrido un error:\n\n{mensaje}")
             else:
                 print(f"ERROR: {titulo} - {mensaje}")
@@ -852,7 +1019,9 @@ Puede exportar el reporte completo usando Ctrl+S.
     def _on_cerrar_aplicacion(self):
         """Maneja el cierre de la aplicación."""
         try:
-            if messagebox.askokcancel("Salir", "¿Está seguro que desea cerrar la aplicación?"):
+            # Sin datos ni resultados que perder no hace falta confirmar
+            hay_trabajo = self.datos_balanceados or self._datos_editados
+            if not hay_trabajo or messagebox.askokcancel("Salir", "¿Está seguro que desea cerrar la aplicación?"):
                 self.root.quit()
                 self.root.destroy()
         except:
@@ -8,10 +8,24 @@ Contiene:
 
 from .validacion import Validador, ValidacionError
 
-# Importar estilos solo si es necesario (evitar dependencia de tkinter)
-try:
-    from .estilos import EstilosModernos, COLORES, FUENTES, ESPACIADO
-    __all__ = ['Validador', 'ValidacionError', 'EstilosModernos', 'COLORES', 'FUENTES', 'ESPACIADO']
-except ImportError:
-    # Si tkinter no está disponible, solo exportar validación
-    __all__ = ['Validador', 'ValidacionError']
\ No newline at end of file
+# Los estilos (y con ellos tkinter) se importan solo cuando se solicitan,
+# de modo que el uso sin interfaz gráfica no carga Tcl/Tk
+_NOMBRES_ESTILOS = ('EstilosModernos', 'COLORES', 'FUENTES', 'ESPACIADO')
+
+_NOMBRES_VALIDACION = ['Validador', 'ValidacionError']
+
+
+def __getattr__(nombre):
+    if nombre == '__all__':
+        # `from utils import *`: incluir los estilos solo si tkinter está disponible
+        try:
+            from . import estilos
+        except ImportError:
+            return list(_NOMBRES_VALIDACION)
+        return [*_NOMBRES_VALIDACION, *_NOMBRES_ESTILOS]
+    if nombre in _NOMBRES_ESTILOS:
+        from . import estilos
+        valores = {clave: getattr(estilos, clave) for clave in _NOMBRES_ESTILOS}
+        globals().update(valores)
+        return valores[nombre]
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
@@ -37,6 +37,26 @@ ESPACIADO = {
     'extra_grande': 30
 }
 
+# Opciones comunes a todos los botones
+_BOTON_BASE = {
+    'foreground': 'white',
+    'font': FUENTES['normal'],
+    'borderwidth': 0,
+    'focuscolor': 'none'
+}
+
+# Botones: (estilo, color de fondo, padding, colores (activo, presionado) o None)
+_ESTILOS_BOTONES = (
+    ('Primario.TButton', 'primario', (20, 10), ('#1F5F80', '#1A4D6B')),
+    ('Secundario.TButton', 'secundario', (20, 10), ('#7A2B56', '#5C1F41')),
+    ('Acento.TButton', 'acento', (15, 8), ('#D17600', '#B85F00')),
+    ('Exito.TButton', 'exito', (15, 8), None),
+    ('Error.TButton', 'error', (15, 8), None),
+)
+
+# Los estilos ttk se registran una sola vez por proceso
+_TEMA_CONFIGURADO = False
+
 
 class EstilosModernos:
     """
@@ -69,65 +89,29 @@ class EstilosModernos:
         # Configurar estilos para progress bars
         EstilosModernos._configurar_progressbar(style)
     
+    @staticmethod
+    def asegurar_tema_principal():
+        """
+        Aplica el tema principal solo si aún no se aplicó.
+        Permite que cada panel garantice sus estilos sin volver a registrarlos.
+        """
+        global _TEMA_CONFIGURADO
+        if _TEMA_CONFIGURADO:
+            return
+        
+        EstilosModernos.configurar_tema_principal()
+        _TEMA_CONFIGURADO = True
+    
     @staticmethod
     def _configurar_botones(style):
         """Configura estilos para botones."""
-        # Botón primario
-        style.configure('Primario.TButton',
-                       background=COLORES['primario'],
-                       foreground='white',
-                       font=FUENTES['normal'],
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(20, 10))
-        
-        style.map('Primario.TButton',
-                 background=[('active', '#1F5F80'),
-                            ('pressed', '#1A4D6B')])
-        
-        # Botón secundario
-        style.configure('Secundario.TButton',
-                       background=COLORES['secundario'],
-                       foreground='white',
-                       font=FUENTES['normal'],
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(20, 10))
-        
-        style.map('Secundario.TButton',
-                 background=[('active', '#7A2B56'),
-                            ('pressed', '#5C1F41')])
-        
-        # Botón de acento
-        style.configure('Acento.TButton',
-                       background=COLORES['acento'],
-                       foreground='white',
-                       font=FUENTES['normal'],
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(15, 8))
-        
-        style.map('Acento.TButton',
-                 background=[('active', '#D17600'),
-                            ('pressed', '#B85F00')])
-        
-        # Botón de éxito
-        style.configure('Exito.TButton',
-                       background=COLORES['exito'],
-                       foreground='white',
-                       font=FUENTES['normal'],
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(15, 8))
-        
-        # Botón de error
-        style.configure('Error.TButton',
-                       background=COLORES['error'],
-                       foreground='white',
-                       font=FUENTES['normal'],
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(15, 8))
+        colores = COLORES
+        configurar = style.configure
+        for nombre, color, padding, activo_presionado in _ESTILOS_BOTONES:
+            configurar(nombre, background=colores[color], padding=padding, **_BOTON_BASE)
+            if activo_presionado is not None:
+                activo, presionado = activo_presionado
+                style.map(nombre, background=[('active', activo), ('pressed', presionado)])
     
     @staticmethod
     def _configurar_frames(style):
@@ -280,26 +264,31 @@ class EstilosModernos:
     def crear_tooltip(widget, texto):
         """
         Crea un tooltip simple para un widget.
+        La ventana del tooltip se crea en la primera entrada del cursor y
+        luego solo se muestra u oculta.
         """
+        tooltip = None
+        
         def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            nonlocal tooltip
+            if tooltip is None:
+                tooltip = tk.Toplevel(widget)
+                tooltip.wm_overrideredirect(True)
+                
+                label = tk.Label(tooltip, 
+                               text=texto,
+                               background=COLORES['texto_primario'],
+                               foreground='white',
+                               font=FUENTES['pequena'],
+                               padx=8, pady=4)
+                label.pack()
             
-            label = tk.Label(tooltip, 
-                           text=texto,
-                           background=COLORES['texto_primario'],
-                           foreground='white',
-                           font=FUENTES['pequena'],
-                           padx=8, pady=4)
-            label.pack()
-            
-            widget.tooltip = tooltip
+            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            tooltip.wm_deiconify()
         
         def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+            if tooltip is not None:
+                tooltip.wm_withdraw()
         
         widget.bind('<Enter>', on_enter)
         widget.bind('<Leave>', on_leave)
@@ -0,0 +1,40 @@
+"""
+Kernels numéricos para la preparación de datos de los gráficos.
+
+Si Numba está instalado, los kernels se compilan con @njit (con caché en
+disco, por lo que la compilación se paga una sola vez). Si no lo está, se
+usa una implementación equivalente con NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _utilizaciones_kernel(tiempos: np.ndarray, tiempo_ciclo: float) -> np.ndarray:
+    """Calcula la utilización (%) de cada estación a partir de sus tiempos totales."""
+    resultado = np.empty_like(tiempos)
+    for i in range(tiempos.shape[0]):
+        resultado[i] = tiempos[i] / tiempo_ciclo * 100.0
+    return resultado
+
+
+if njit is not None:
+    _utilizaciones = njit(cache=True)(_utilizaciones_kernel)
+else:
+    def _utilizaciones(tiempos: np.ndarray, tiempo_ciclo: float) -> np.ndarray:
+        return tiempos * (100.0 / tiempo_ciclo)
+
+
+def calcular_utilizaciones(tiempos: np.ndarray, tiempo_ciclo: float) -> np.ndarray:
+    """
+    Calcula la utilización (%) de todas las estaciones en una sola pasada.
+    Equivale a Estacion.calcular_utilizacion() aplicado a cada estación.
+    """
+    tiempos = np.ascontiguousarray(tiempos, dtype=np.float64)
+    if tiempo_ciclo == 0:
+        return np.zeros_like(tiempos)
+    return _utilizaciones(tiempos, float(tiempo_ciclo))
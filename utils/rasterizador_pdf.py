@@ -0,0 +1,39 @@
+"""
+Rasterización de páginas PDF en un proceso separado.
+
+Este módulo es el punto de entrada del proceso de render de la vista previa.
+No importa tkinter ni otros componentes de la interfaz, de modo que el proceso
+hijo (iniciado con "spawn") solo carga PyMuPDF.
+"""
+
+from typing import Optional
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+
+# Documento abierto dentro del proceso de render: (versión, documento)
+_documento_en_proceso = (None, None)
+
+
+def rasterizar_pagina(version: int, contenido: Optional[bytes], indice: int, zoom: float):
+    """
+    Se ejecuta en el proceso de render, fuera del GIL de la interfaz.
+    El contenido del PDF solo llega con la primera petición de cada versión; el
+    documento se abre en memoria una vez y se devuelve (ancho, alto, muestras RGB).
+    """
+    global _documento_en_proceso
+    version_abierta, documento = _documento_en_proceso
+    if version_abierta != version:
+        if documento is not None:
+            documento.close()
+        documento = fitz.open(stream=contenido, filetype="pdf")
+        _documento_en_proceso = (version, documento)
+
+        # Vaciar la caché interna de MuPDF (glifos, imágenes) del documento anterior
+        fitz.TOOLS.store_shrink(100)
+
+    pix = documento[indice].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return pix.width, pix.height, pix.samples
@@ -1,7 +1,15 @@
 import re
+import string
 from typing import List, Any, Union
 
 
+# Tabla que elimina los caracteres permitidos en un ID: si no queda nada, el ID es válido
+_ID_TAREA_TRANS = str.maketrans('', '', string.ascii_letters + string.digits + '-_')
+_ID_TAREA_MAX = 10
+
+# Patrones compilados una sola vez
+_ESPACIOS_RE = re.compile(r'\s+')
+
 class ValidacionError(Exception):
     """Excepción personalizada para errores de validación."""
     pass
@@ -21,13 +29,17 @@ class Validador:
         if not id_tarea or not isinstance(id_tarea, str):
             return False
         
-        # Patrón: letras, números, guiones, hasta 10 caracteres
-        patron = r'^[A-Za-z0-9\-_]{1,10}$'
-        return bool(re.match(patron, id_tarea.strip()))
+        id_tarea = id_tarea.strip()
+        return 1 <= len(id_tarea) <= _ID_TAREA_MAX and not id_tarea.translate(_ID_TAREA_TRANS)
     
     @staticmethod
     def validar_tiempo_positivo(tiempo: Union[int, float]) -> bool:
         """Valida que el tiempo sea un número positivo."""
+        # Camino rápido para valores ya numéricos (bool no se acepta como número)
+        if isinstance(tiempo, bool):
+            return False
+        if isinstance(tiempo, (int, float)):
+            return tiempo > 0
         try:
             tiempo_float = float(tiempo)
             return tiempo_float > 0
@@ -62,14 +74,21 @@ class Validador:
             if not Validador.validar_id_tarea(precedencia):
                 errores.append(f"ID de precedencia inválido: '{precedencia}'")
         
+        # Conjunto único de precedencias, reutilizado para existencia y duplicados
+        precedencias_unicas = dict.fromkeys(precedencias)
+        
         # Validar que las precedencias existan (si se proporciona lista de tareas)
         if tareas_existentes is not None:
-            for precedencia in precedencias:
-                if precedencia not in tareas_existentes:
-                    errores.append(f"Precedencia '{precedencia}' no existe")
+            existentes = set(tareas_existentes)
+            faltantes = precedencias_unicas.keys() - existentes
+            if faltantes:
+                # Recorrer en orden de aparición para mensajes estables
+                for precedencia in precedencias_unicas:
+                    if precedencia in faltantes:
+                        errores.append(f"Precedencia '{precedencia}' no existe")
         
         # Validar duplicados
-        if len(precedencias) != len(set(precedencias)):
+        if len(precedencias) != len(precedencias_unicas):
             errores.append("Hay precedencias duplicadas")
         
         return errores
@@ -77,6 +96,11 @@ class Validador:
     @staticmethod
     def validar_demanda_diaria(demanda: Union[int, float]) -> bool:
         """Valida que la demanda diaria sea válida."""
+        # Camino rápido para enteros (bool no se acepta como número)
+        if isinstance(demanda, bool):
+            return False
+        if isinstance(demanda, int):
+            return demanda > 0
         try:
             demanda_int = int(demanda)
             return demanda_int > 0
@@ -86,6 +110,11 @@ class Validador:
     @staticmethod
     def validar_tiempo_disponible(tiempo: Union[int, float]) -> bool:
         """Valida que el tiempo disponible sea válido (en minutos)."""
+        # Camino rápido para valores ya numéricos (bool no se acepta como número)
+        if isinstance(tiempo, bool):
+            return False
+        if isinstance(tiempo, (int, float)):
+            return 60 <= tiempo <= 1440  # Entre 1 hora y 24 horas
         try:
             tiempo_float = float(tiempo)
             return 60 <= tiempo_float <= 1440  # Entre 1 hora y 24 horas
@@ -100,29 +129,38 @@ class Validador:
         
         # Remover espacios extra y normalizar
         texto = texto.strip()
-        texto = re.sub(r'\s+', ' ', texto)  # Múltiples espacios -> uno solo
+        texto = _ESPACIOS_RE.sub(' ', texto)  # Múltiples espacios -> uno solo
         return texto
     
     @staticmethod
     def validar_datos_completos_tarea(id_tarea: str, descripcion: str, 
-                                    tiempo: Any, precedencias: List[str] = None) -> List[str]:
+                                    tiempo: Any, precedencias: List[str] = None,
+                                    detener_en_primero: bool = False) -> List[str]:
         """
         Valida todos los datos de una tarea completa.
+        Las comprobaciones van de la más barata a la más costosa; con
+        `detener_en_primero` se retorna tras el primer error encontrado.
         Retorna lista de errores encontrados.
         """
         errores = []
         
-        # Validar ID
-        if not Validador.validar_id_tarea(id_tarea):
-            errores.append("ID de tarea inválido (solo letras, números, guiones, máx 10 caracteres)")
+        # Validar tiempo
+        if not Validador.validar_tiempo_positivo(tiempo):
+            errores.append("Tiempo debe ser un número positivo")
+            if detener_en_primero:
+                return errores
         
         # Validar descripción
         if not Validador.validar_descripcion(descripcion):
             errores.append("Descripción inválida (1-100 caracteres)")
+            if detener_en_primero:
+                return errores
         
-        # Validar tiempo
-        if not Validador.validar_tiempo_positivo(tiempo):
-            errores.append("Tiempo debe ser un número positivo")
+        # Validar ID
+        if not Validador.validar_id_tarea(id_tarea):
+            errores.append("ID de tarea inválido (solo letras, números, guiones, máx 10 caracteres)")
+            if detener_en_primero:
+                return errores
         
         # Validar precedencias
         if precedencias is not None: